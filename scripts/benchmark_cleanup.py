@@ -0,0 +1,135 @@
+import os
+import re
+import sys
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import check_cleanup
+
+# Anzahl der synthetischen Dateien und Zeilen pro Datei
+ANZAHL_DATEIEN = 200
+ZEILEN_PRO_DATEI = 400
+
+# Füllzeilen und Zeilen mit Treffern für die synthetischen Dateien
+fuell_zeilen = [
+    "import React from 'react';",
+    "export const Component = () => <div className=\"container\">Inhalt</div>;",
+    "const value = items.map((item) => item.id).filter(Boolean);",
+    "// Kommentar ohne relevante Begriffe",
+]
+
+treffer_zeilen = [
+    "import { createClient } from '@supabase/supabase-js';",
+    "import { BlogList } from '@/pages/blog';",
+    "const { user } = useAuth();",
+    "fetch('/api/posts').then((res) => res.json());",
+]
+
+def legacy_is_binary_file(file_path):
+    """Bisherige Binär-Erkennung: Datei öffnen und 1 KB als UTF-8 dekodieren"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            file.read(1024)
+            return False
+    except Exception:
+        return True
+
+def legacy_check_file(file_path, search_terms):
+    """Bisheriger Pfad: eine Regex-Suche pro Begriff und Zeile, Datei je Gruppe neu öffnen"""
+    results = []
+    if legacy_is_binary_file(file_path):
+        return results
+
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line_num, line in enumerate(file, 1):
+            for term in search_terms:
+                if re.search(term, line, re.IGNORECASE):
+                    results.append({'line_num': line_num, 'term': term, 'line': line.strip()})
+    return results
+
+def legacy_scan(file_paths):
+    """Führt den bisherigen Scan mit zwei check_file-Aufrufen pro Datei aus"""
+    return [
+        (legacy_check_file(path, check_cleanup.supabase_keywords),
+         legacy_check_file(path, check_cleanup.blog_keywords))
+        for path in file_paths
+    ]
+
+def matcher_scan(file_paths):
+    """Führt den neuen Scan mit dem kombinierten Matcher aus"""
+    results = []
+    for path in file_paths:
+        matches = check_cleanup.scan_file(path)
+        results.append((matches['supabase'], matches['blog']))
+    return results
+
+def create_synthetic_files(target_dir, seed=42):
+    """Erzeugt synthetische Quelldateien mit etwa 5% Trefferzeilen"""
+    rng = random.Random(seed)
+    file_paths = []
+
+    for index in range(ANZAHL_DATEIEN):
+        lines = [
+            rng.choice(treffer_zeilen) if rng.random() < 0.05 else rng.choice(fuell_zeilen)
+            for _ in range(ZEILEN_PRO_DATEI)
+        ]
+        file_path = os.path.join(target_dir, f'component_{index}.tsx')
+        with open(file_path, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(lines) + '\n')
+        file_paths.append(file_path)
+
+    return file_paths
+
+def measure(function, *args):
+    """Misst die Laufzeit einer Funktion und gibt (Sekunden, Ergebnis) zurück"""
+    start_time = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start_time, result
+
+def measure_memory(function, *args):
+    """Misst den Speicher, den das Ergebnis einer Funktion danach noch belegt (in Bytes)"""
+    tracemalloc.start()
+    try:
+        result = function(*args)
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return retained, result
+
+def main():
+    """Vergleicht den bisherigen Scan-Pfad mit dem kombinierten Matcher (Laufzeit und Speicher der Treffer)"""
+    print(f"Python Version: {sys.version}")
+    print(f"Synthetische Dateien: {ANZAHL_DATEIEN} x {ZEILEN_PRO_DATEI} Zeilen")
+
+    target_dir = tempfile.mkdtemp(prefix='check_cleanup_bench_')
+    try:
+        file_paths = create_synthetic_files(target_dir)
+
+        legacy_time, legacy_results = measure(legacy_scan, file_paths)
+        matcher_time, matcher_results = measure(matcher_scan, file_paths)
+
+        if legacy_results != matcher_results:
+            print("FEHLER: Die Ergebnisse der beiden Pfade unterscheiden sich!")
+            sys.exit(1)
+
+        print(f"Bisheriger Pfad:     {legacy_time:.3f} Sekunden")
+        print(f"Kombinierter Matcher: {matcher_time:.3f} Sekunden")
+        print(f"Beschleunigung:      {legacy_time / matcher_time:.1f}x")
+
+        # Speicher der Treffer: ein Dict pro Treffer gegen die spaltenweise MatchList
+        legacy_memory, legacy_results = measure_memory(legacy_scan, file_paths)
+        matcher_memory, matcher_results = measure_memory(matcher_scan, file_paths)
+        match_count = sum(len(supabase) + len(blog) for supabase, blog in matcher_results)
+
+        print(f"Treffer insgesamt:   {match_count}")
+        print(f"Speicher Dicts:      {legacy_memory / 1024:.0f} KB ({legacy_memory / match_count:.0f} Bytes pro Treffer)")
+        print(f"Speicher MatchList:  {matcher_memory / 1024:.0f} KB ({matcher_memory / match_count:.0f} Bytes pro Treffer)")
+        print(f"Einsparung:          {legacy_memory / matcher_memory:.1f}x")
+    finally:
+        shutil.rmtree(target_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
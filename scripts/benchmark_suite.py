@@ -0,0 +1,259 @@
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import contextlib
+import subprocess
+from datetime import datetime, timezone
+
+import check_cleanup
+import cleanup_report
+import create_project
+import print_fix_files
+from scan_engine import create_executor
+from benchmark_cleanup import fuell_zeilen, treffer_zeilen
+
+# Verzeichnisse unter src/, auf die die synthetischen Dateien verteilt werden
+quell_verzeichnisse = ['components', 'pages', 'lib', 'hooks', 'services']
+
+# Zeilen, die in einem Teil der Dateien zusätzlich vorkommen
+import_zeilen = [
+    "import { cn } from '@/lib/utils';",
+    "import { supabase } from '@/lib/supabase';",
+    "import { BlogPost } from '@/types/blog';",
+]
+bild_zeile = '<img src="/images/modern-office-building.png" alt="" />'
+
+def parse_args():
+    """Liest die Kommandozeilen-Argumente"""
+    parser = argparse.ArgumentParser(description='Misst die Cleanup- und Check-Scripts gegen synthetische Next.js-Projekte.')
+    parser.add_argument('--files', type=int, default=2000, help='Anzahl der Dateien im synthetischen Projekt (Standard: 2000)')
+    parser.add_argument('--depth', type=int, default=4, help='Maximale Verzeichnistiefe unter src/ (Standard: 4)')
+    parser.add_argument('--lines', type=int, default=200, help='Zeilen pro Textdatei (Standard: 200)')
+    parser.add_argument('--density', type=float, default=0.02, help='Anteil der Zeilen mit Keyword-Treffern (Standard: 0.02)')
+    parser.add_argument('--binary-ratio', type=float, default=0.1, help='Anteil der Binärdateien (Standard: 0.1)')
+    parser.add_argument('--repeat', type=int, default=3, help='Wiederholungen pro Messung (Standard: 3)')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='Prozesse für die Check-Scripts (0 = alle CPU-Kerne, Standard: 1)')
+    parser.add_argument('--seed', type=int, default=42, help='Startwert für den Zufallsgenerator (Standard: 42)')
+    parser.add_argument('--output', '-o', default='benchmark_results.json',
+                        help='JSON-Datei für die Ergebnisse (Standard: benchmark_results.json)')
+    return parser.parse_args()
+
+def random_source_dir(rng, depth):
+    """Wählt ein Verzeichnis unter src/ mit zufälliger Tiefe zwischen 1 und depth"""
+    parts = ['src', rng.choice(quell_verzeichnisse)]
+    for level in range(rng.randint(0, max(0, depth - 1))):
+        parts.append(f'd{level}_{rng.randrange(4)}')
+    return os.path.join(*parts)
+
+def write_file(target_dir, rel_path, data):
+    """Schreibt eine Datei (str oder bytes) und legt fehlende Verzeichnisse an"""
+    file_path = os.path.join(target_dir, rel_path)
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    with open(file_path, 'wb') as file:
+        file.write(data)
+    return len(data)
+
+def create_synthetic_tree(target_dir, args):
+    """Erzeugt ein Next.js-artiges Projekt und gibt Statistiken dazu zurück"""
+    rng = random.Random(args.seed)
+    stats = {'text_files': 0, 'binary_files': 0, 'bytes': 0}
+
+    # Feste Projektdateien: package.json mit Supabase-Abhängigkeit, tsconfig.json mit @/-Alias
+    package_json = {
+        'name': 'synthetic-site',
+        'dependencies': {'next': '^14.0.0', 'react': '^18.2.0', '@supabase/supabase-js': '^2.0.0'}
+    }
+    tsconfig = {'compilerOptions': {'baseUrl': '.', 'paths': {'@/*': ['./src/*']}}}
+    fixed_files = {
+        'package.json': json.dumps(package_json, indent=2),
+        'tsconfig.json': json.dumps(tsconfig, indent=2),
+        os.path.join('src', 'lib', 'utils.ts'): "export const cn = (...classes) => classes.filter(Boolean).join(' ');\n",
+    }
+    for rel_path, content in fixed_files.items():
+        stats['bytes'] += write_file(target_dir, rel_path, content)
+        stats['text_files'] += 1
+
+    binary_count = int(args.files * args.binary_ratio)
+    text_count = max(0, args.files - binary_count - len(fixed_files))
+
+    for index in range(text_count):
+        lines = [line for line in import_zeilen if rng.random() < args.density * 10]
+        lines += [
+            rng.choice(treffer_zeilen) if rng.random() < args.density else rng.choice(fuell_zeilen)
+            for _ in range(args.lines)
+        ]
+        if rng.random() < args.density:
+            lines.append(bild_zeile)
+
+        ext = rng.choice(('.tsx', '.ts'))
+        rel_path = os.path.join(random_source_dir(rng, args.depth), f'module_{index}{ext}')
+        stats['bytes'] += write_file(target_dir, rel_path, '\n'.join(lines) + '\n')
+        stats['text_files'] += 1
+
+    # Binärdateien: Bilder unter public/images/ und Schriften unter src/assets/
+    for index in range(binary_count):
+        data = b'\x89PNG\r\n\x1a\n\x00' + rng.randbytes(rng.randint(1024, 16 * 1024))
+        if index % 2:
+            rel_path = os.path.join('public', 'images', f'image_{index}.png')
+        else:
+            rel_path = os.path.join('src', 'assets', f'font_{index}.woff')
+        stats['bytes'] += write_file(target_dir, rel_path, data)
+        stats['binary_files'] += 1
+
+    return stats
+
+def run_benchmark(function, repeat):
+    """Führt eine Messung mehrfach aus und gibt die Laufzeiten und das letzte Ergebnis zurück"""
+    runs = []
+    result = None
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        result = function()
+        runs.append(time.perf_counter() - start_time)
+    return {
+        'runs': runs,
+        'min': min(runs),
+        'median': statistics.median(runs),
+        'max': max(runs),
+        'result': result
+    }
+
+def bench_scan_for_references(tree_dir, jobs):
+    """Messung: Keyword-Suche von check_cleanup über das ganze Projekt"""
+    def run():
+        with create_executor(jobs) as executor:
+            supabase_refs, blog_refs, total_files = check_cleanup.scan_for_references(executor)
+        return {
+            'files': total_files,
+            'supabase_files': len(supabase_refs),
+            'blog_files': len(blog_refs),
+            'matches': sum(len(ref['matches']) for ref in supabase_refs + blog_refs)
+        }
+    return run
+
+def bench_check_verwaiste_importe(tree_dir, jobs):
+    """Messung: Import-Graph und verwaiste Importe von check_cleanup"""
+    def run():
+        with create_executor(jobs) as executor:
+            return {'orphan_imports': len(check_cleanup.check_verwaiste_importe(executor))}
+    return run
+
+def bench_check_cleanup_run(use_cache):
+    """Messung: kompletter Lauf von check_cleanup.run() inklusive Auswertung und Ausgabe (ohne bzw. mit Scan-Cache)"""
+    def bench(tree_dir, jobs):
+        args = argparse.Namespace(jobs=jobs, no_cache=not use_cache, importers=[], format='text', index_query=[])
+
+        def run():
+            with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+                return check_cleanup.run(args, cleanup_report.TextReporter(devnull))
+
+        if use_cache:
+            # Cache einmal füllen, gemessen werden nur Läufe mit Treffern
+            run()
+        return run
+    return bench
+
+def bench_image_references(tree_dir, jobs):
+    """Messung: Durchlauf von print_fix_files (Bildreferenzen und Bildliste)"""
+    def run():
+        _, reference_check, image_check = print_fix_files.scan_project(tree_dir, [])
+        return {
+            'image_references': len(reference_check.image_references),
+            'images': len(image_check.all_images)
+        }
+    return run
+
+def bench_import_create_project(tree_dir, jobs):
+    """Messung: Startkosten von create_project - Import in einem frischen Interpreter, ohne Vorlagen zu laden"""
+    code = (
+        'import sys, time; start = time.perf_counter(); import create_project; '
+        'print(time.perf_counter() - start, len(create_project.templates), create_project.load_template.cache_info().currsize)'
+    )
+
+    def run():
+        output = subprocess.run(
+            [sys.executable, '-c', code], cwd=os.path.dirname(os.path.abspath(create_project.__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout.split()
+        return {'import_seconds': float(output[0]), 'templates': int(output[1]), 'loaded_templates': int(output[2])}
+    return run
+
+def bench_create_project_structure(tree_dir, jobs):
+    """Messung: Gerüst von create_project in ein leeres Verzeichnis schreiben"""
+    def run():
+        target_dir = tempfile.mkdtemp(prefix='create_project_bench_')
+        try:
+            create_project.BASE_DIR = target_dir
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                create_project.create_project_structure()
+            return {'files': sum(len(files) for _, _, files in os.walk(target_dir))}
+        finally:
+            shutil.rmtree(target_dir, ignore_errors=True)
+    return run
+
+# Alle Messungen in Ausführungs-Reihenfolge
+benchmarks = {
+    'scan_for_references': bench_scan_for_references,
+    'check_verwaiste_importe': bench_check_verwaiste_importe,
+    'check_cleanup_run': bench_check_cleanup_run(use_cache=False),
+    'check_cleanup_run_cached': bench_check_cleanup_run(use_cache=True),
+    'print_fix_files_image_scan': bench_image_references,
+    'import_create_project': bench_import_create_project,
+    'create_project_structure': bench_create_project_structure,
+}
+
+def main():
+    """Erzeugt ein synthetisches Projekt, misst alle Scripts und schreibt die Ergebnisse als JSON"""
+    args = parse_args()
+
+    print(f"Python Version: {sys.version}")
+    print(f"Synthetisches Projekt: {args.files} Dateien, Tiefe {args.depth}, {args.lines} Zeilen, "
+          f"Trefferdichte {args.density}, Binäranteil {args.binary_ratio}")
+
+    tree_dir = tempfile.mkdtemp(prefix='cleanup_suite_')
+    try:
+        tree_stats = create_synthetic_tree(tree_dir, args)
+        check_cleanup.root_dir = tree_dir
+
+        results = {}
+        for name, benchmark in benchmarks.items():
+            results[name] = run_benchmark(benchmark(tree_dir, args.jobs), args.repeat)
+            print(f"  {name:<30} min {results[name]['min']:.3f} s, median {results[name]['median']:.3f} s")
+    finally:
+        shutil.rmtree(tree_dir, ignore_errors=True)
+
+    report = {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'parameters': {
+            'files': args.files,
+            'depth': args.depth,
+            'lines': args.lines,
+            'density': args.density,
+            'binary_ratio': args.binary_ratio,
+            'repeat': args.repeat,
+            'jobs': args.jobs,
+            'seed': args.seed
+        },
+        'tree': tree_stats,
+        'benchmarks': results
+    }
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+
+    print(f"Ergebnisse gespeichert in {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,18 @@
 import os
 import re
 import sys
-from colorama import init, Fore, Style
-
-# Colorama für farbige Konsolenausgaben initialisieren
-init()
+import argparse
+import functools
+import contextlib
+
+from scan_engine import (
+    KeywordMatcher, FileRecord, Traversal, analyze_data, analyze_path, create_executor, walk_records
+)
+from scan_cache import ScanCache
+from token_index import TokenIndex
+from import_graph import ImportGraph, extract_specifiers, parse_path_aliases
+from cleanup_report import ListReporter, TextReporter, NdjsonReporter
+from terminal_render import Fore, Style, install_stdout
 
 # Stammverzeichnis des Projekts
 root_dir = r'C:\Users\damja\WebstormProjects\RitterDigitalSite'
@@ -36,12 +44,24 @@ blog_keywords = [
     r'@/pages/blog'
 ]
 
+# Alle Keyword-Gruppen in einem Muster, damit jede Datei nur einmal gelesen wird
+keyword_matcher = KeywordMatcher({
+    'supabase': supabase_keywords,
+    'blog': blog_keywords
+})
+
 # Datei-Erweiterungen, die durchsucht werden sollen
 extensions_to_search = [
     '.ts', '.tsx', '.js', '.jsx', '.json', '.md', '.css',
     '.html', '.xml', '.yml', '.yaml'
 ]
 
+# Scan-Cache relativ zum Stammverzeichnis
+cache_file = os.path.join('.cache', 'check_cleanup.sqlite')
+
+# Token-Index für Wortgrenzen-Suchen, gemeinsam mit print_files_to_clean
+index_file = os.path.join('.cache', 'token_index.sqlite')
+
 # Ordner, die übersprungen werden sollen
 dirs_to_skip = [
     'node_modules',
@@ -55,142 +75,292 @@ def should_skip_dir(dir_path):
     dir_name = os.path.basename(dir_path)
     return dir_name in dirs_to_skip or dir_name.startswith('.')
 
-def is_binary_file(file_path):
-    """Überprüft, ob eine Datei binär ist (nicht als Text lesbar)"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            file.read(1024)
-            return False
-    except UnicodeDecodeError:
-        return True
-    except Exception:
-        return True
+def scan_file(file_path, matcher=keyword_matcher):
+    """Überprüft eine einzelne Datei in einem Durchgang auf alle Keyword-Gruppen des Matchers"""
+    # Ein Lesevorgang (bzw. mmap bei großen Dateien): derselbe Puffer entscheidet über Text/Binär
+    # und wird durchsucht
+    results, error, _ = analyze_path(file_path, [('keywords', matcher.scan_text, matcher.scan_buffer)])
+    if error:
+        print(f"{Fore.YELLOW}Fehler beim Lesen von {file_path}: {error}{Style.RESET_ALL}")
+
+    # Binärdateien liefern keine Treffer
+    return results['keywords'] or matcher.empty_results()
+
+@functools.lru_cache(maxsize=None)
+def terms_matcher(search_terms):
+    """Kompiliert eine Liste von Suchbegriffen einmal zu einem Matcher (für check_file)"""
+    return KeywordMatcher({'terms': search_terms})
 
 def check_file(file_path, search_terms):
-    """Überprüft eine Datei auf bestimmte Suchbegriffe und gibt Zeilen zurück, die Treffer enthalten"""
-    results = []
+    """Überprüft eine Datei auf bestimmte Suchbegriffe und gibt Zeilen zurück, die Treffer enthalten.
+
+    Bisherige Schnittstelle (Liste von Dicts mit line_num, term, line) über scan_file.
+    """
+    return [dict(match) for match in scan_file(file_path, terms_matcher(tuple(search_terms)))['terms']]
+
+# Pfade, die nicht mehr existieren sollten
+nicht_existente_pfade = [
+    '@/lib/supabase',
+    '@/hooks/use-supabase',
+    '@/types/blog',
+    '@/pages/blog'
+]
 
-    # Binärdateien überspringen
-    if is_binary_file(file_path):
-        return results
+# Alles, was die Scan-Ergebnisse beeinflusst - Änderungen machen den Cache ungültig
+cache_config = {
+    'keywords': keyword_matcher.groups
+}
 
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            for line_num, line in enumerate(file, 1):
-                for term in search_terms:
-                    if re.search(term, line, re.IGNORECASE):
-                        results.append({
-                            'line_num': line_num,
-                            'term': term,
-                            'line': line.strip()
-                        })
-        return results
-    except Exception as e:
-        print(f"{Fore.YELLOW}Fehler beim Lesen von {file_path}: {e}{Style.RESET_ALL}")
-        return []
-
-def scan_for_references():
-    """Durchsucht alle Dateien nach Referenzen zu Supabase und Blog"""
-    supabase_references = []
-    blog_references = []
+def scan_keywords(text):
+    """Analysefunktion des Referenz-Checks (läuft im --jobs-Modus im Pool-Prozess)"""
+    return keyword_matcher.scan_text(text)
 
-    # Gesamtzahl der durchsuchten Dateien
-    total_files = 0
+def scan_keywords_buffer(buffer, start=0):
+    """Puffer-Variante des Referenz-Checks für große Dateien (mmap)"""
+    return keyword_matcher.scan_buffer(buffer, start)
 
-    for root, dirs, files in os.walk(root_dir):
-        # Zu überspringende Verzeichnisse filtern
-        dirs[:] = [d for d in dirs if not should_skip_dir(os.path.join(root, d))]
+def find_supabase_packages(text):
+    """Analysefunktion des package.json-Checks: Supabase-Pakete in den Abhängigkeiten"""
+    return re.findall(r'"(@supabase/[^"]+)"\s*:\s*"([^"]+)"', text)
 
-        for file in files:
-            # Dateiendung überprüfen
-            file_ext = os.path.splitext(file)[1].lower()
-            if file_ext not in extensions_to_search:
-                continue
+class ReferenceCheck:
+    """Check: Supabase- und Blog-Referenzen in allen Dateien mit durchsuchter Endung"""
 
-            file_path = os.path.join(root, file)
-            rel_path = os.path.relpath(file_path, root_dir)
-            total_files += 1
+    name = 'references'
+    analyze = staticmethod(scan_keywords)
+    analyze_buffer = staticmethod(scan_keywords_buffer)
 
-            # Auf Supabase-Referenzen prüfen
-            supabase_results = check_file(file_path, supabase_keywords)
-            if supabase_results:
-                supabase_references.append({
-                    'file': rel_path,
-                    'matches': supabase_results
-                })
+    def __init__(self, reporter):
+        # Treffer gehen sofort an den Reporter, hier bleiben nur die Zähler für die Zusammenfassung
+        self.reporter = reporter
+        self.file_counts = {group: 0 for group in keyword_matcher.groups}
+        self.match_counts = {group: 0 for group in keyword_matcher.groups}
+        # Gesamtzahl der durchsuchten Dateien
+        self.total_files = 0
 
-            # Auf Blog-Referenzen prüfen
-            blog_results = check_file(file_path, blog_keywords)
-            if blog_results:
-                blog_references.append({
-                    'file': rel_path,
-                    'matches': blog_results
-                })
+    def accepts(self, record):
+        return record.ext in extensions_to_search
 
-    return supabase_references, blog_references, total_files
+    def collect(self, record, results, error):
+        self.total_files += 1
 
-def check_package_json():
-    """Überprüft die package.json auf Supabase-Abhängigkeiten"""
-    package_json_path = os.path.join(root_dir, 'package.json')
+        if error:
+            print(f"{Fore.YELLOW}Fehler beim Lesen von {record.path}: {error}{Style.RESET_ALL}")
+        if not results:
+            return
 
-    if not os.path.exists(package_json_path):
-        print(f"{Fore.YELLOW}package.json nicht gefunden.{Style.RESET_ALL}")
-        return []
+        for group, matches in results.items():
+            if matches:
+                self.file_counts[group] += 1
+                self.match_counts[group] += len(matches)
+                self.reporter.report_references(group, record.rel_path, matches)
 
-    try:
-        with open(package_json_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-            # Suche nach Supabase-Paketen in den Abhängigkeiten
-            matches = re.findall(r'"(@supabase/[^"]+)"\s*:\s*"([^"]+)"', content)
-            return matches
-    except Exception as e:
-        print(f"{Fore.YELLOW}Fehler beim Überprüfen der package.json: {e}{Style.RESET_ALL}")
-        return []
-
-def check_verwaiste_importe():
-    """Sucht nach verwaisten Importen, die auf nicht mehr vorhandene Module verweisen"""
-    verwaiste_importe = []
-
-    # Pfade, die nicht mehr existieren sollten
-    nicht_existente_pfade = [
-        '@/lib/supabase',
-        '@/hooks/use-supabase',
-        '@/types/blog',
-        '@/pages/blog'
-    ]
+    def finish(self):
+        pass
 
-    for root, dirs, files in os.walk(os.path.join(root_dir, 'src')):
-        # Zu überspringende Verzeichnisse filtern
-        dirs[:] = [d for d in dirs if not should_skip_dir(os.path.join(root, d))]
+class PathAliasCheck:
+    """Check: Pfad-Aliase (z.B. @/*) aus der tsconfig.json im Stammverzeichnis"""
 
-        for file in files:
-            # Nur TypeScript/JavaScript Dateien betrachten
-            if not file.endswith(('.ts', '.tsx', '.js', '.jsx')):
-                continue
+    name = 'tsconfig'
+    analyze = staticmethod(parse_path_aliases)
+
+    def __init__(self):
+        self.aliases = None
+
+    def accepts(self, record):
+        return record.rel_path == 'tsconfig.json'
+
+    def collect(self, record, aliases, error):
+        if error:
+            print(f"{Fore.YELLOW}Fehler beim Lesen der tsconfig.json: {error}{Style.RESET_ALL}")
+        self.aliases = aliases
+
+    def finish(self):
+        pass
+
+class FileListCheck:
+    """Check ohne Dateizugriff: sammelt alle Pfade des Durchlaufs zum Auflösen der Importe"""
+
+    name = 'files'
+    analyze = None
 
-            file_path = os.path.join(root, file)
-            rel_path = os.path.relpath(file_path, root_dir)
+    def __init__(self):
+        self.files = set()
 
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+    def accepts(self, record):
+        return True
+
+    def collect(self, record, result, error):
+        self.files.add(record.rel_path.replace(os.sep, '/'))
+
+    def finish(self):
+        pass
+
+class ImportCheck:
+    """Check: verwaiste und nicht auflösbare Importe in TypeScript/JavaScript-Dateien unter src/
+
+    Baut aus den Spezifizierern aller Dateien einen Import-Graphen auf; die Aliase und die
+    Dateiliste kommen aus PathAliasCheck und FileListCheck, die vorher registriert sein müssen.
+    """
+
+    name = 'imports'
+    analyze = staticmethod(extract_specifiers)
+
+    def __init__(self, alias_check, file_list):
+        self.alias_check = alias_check
+        self.file_list = file_list
+        self.specifiers = []
+        self.graph = None
+        self.verwaiste_importe = []
+        self.unaufgeloeste_importe = []
+
+    def accepts(self, record):
+        return record.rel_path.startswith('src' + os.sep) and record.name.endswith(('.ts', '.tsx', '.js', '.jsx'))
+
+    def collect(self, record, specifiers, error):
+        if error:
+            print(f"{Fore.YELLOW}Fehler beim Überprüfen von {record.rel_path}: {error}{Style.RESET_ALL}")
+        if specifiers:
+            self.specifiers.append((record.rel_path, specifiers))
+
+    def finish(self):
+        self.graph = ImportGraph(root_dir, self.alias_check.aliases, self.file_list.files)
+        for rel_path, specifiers in self.specifiers:
+            self.graph.add_file(rel_path, specifiers)
+        self.graph.build()
+
+        self.verwaiste_importe = [
+            {'file': file.replace('/', os.sep), 'import': specifier}
+            for file, specifier in self.graph.imports_with_prefix(nicht_existente_pfade)
+        ]
+        self.unaufgeloeste_importe = [
+            {'file': file.replace('/', os.sep), 'import': specifier}
+            for file, specifier in self.graph.unresolved()
+        ]
+
+def import_checks():
+    """Erzeugt den Import-Check samt der Checks, von denen er abhängt (in Registrierungs-Reihenfolge)"""
+    alias_check = PathAliasCheck()
+    file_list = FileListCheck()
+    return [alias_check, file_list, ImportCheck(alias_check, file_list)]
+
+class PackageJsonCheck:
+    """Check: Supabase-Abhängigkeiten in der package.json im Stammverzeichnis"""
+
+    name = 'package_json'
+    analyze = staticmethod(find_supabase_packages)
+
+    def __init__(self):
+        self.packages = []
+        self.found = False
+
+    def accepts(self, record):
+        return record.rel_path == 'package.json'
+
+    def collect(self, record, packages, error):
+        self.found = True
+        if error:
+            print(f"{Fore.YELLOW}Fehler beim Überprüfen der package.json: {error}{Style.RESET_ALL}")
+        self.packages = [tuple(package) for package in packages or []]
+
+    def finish(self):
+        if not self.found:
+            print(f"{Fore.YELLOW}package.json nicht gefunden.{Style.RESET_ALL}")
+
+def run_checks(checks, executor=None, cache=None):
+    """Führt alle Checks in einem gemeinsamen Durchlauf über root_dir aus"""
+    traversal = Traversal(root_dir, should_skip_dir)
+    for check in checks:
+        traversal.register(check)
+    traversal.run(executor, cache)
+    return checks
+
+def scan_for_references(executor=None, cache=None):
+    """Durchsucht alle Dateien nach Referenzen zu Supabase und Blog"""
+    reporter = ListReporter()
+    check, = run_checks([ReferenceCheck(reporter)], executor, cache)
+    return reporter.references['supabase'], reporter.references['blog'], check.total_files
+
+def check_package_json():
+    """Überprüft die package.json auf Supabase-Abhängigkeiten"""
+    check = PackageJsonCheck()
+    package_json_path = os.path.join(root_dir, 'package.json')
 
-                    for pfad in nicht_existente_pfade:
-                        # Suche nach Import-Statements mit diesen Pfaden
-                        imports = re.findall(rf'import\s+.*?from\s+[\'"]({pfad}[^\'"]*)[\'"]', content)
-                        if imports:
-                            for imp in imports:
-                                verwaiste_importe.append({
-                                    'file': rel_path,
-                                    'import': imp
-                                })
-            except Exception as e:
-                print(f"{Fore.YELLOW}Fehler beim Überprüfen von {rel_path}: {e}{Style.RESET_ALL}")
+    if os.path.exists(package_json_path):
+        record = FileRecord(package_json_path, 'package.json')
+        try:
+            results = analyze_data(record.data, [(check.name, check.analyze)], record.ext)
+            check.collect(record, results[check.name], None)
+        except OSError as e:
+            check.collect(record, None, e)
 
-    return verwaiste_importe
+    check.finish()
+    return check.packages
+
+def check_verwaiste_importe(executor=None):
+    """Sucht nach verwaisten Importen, die auf nicht mehr vorhandene Module verweisen"""
+    *_, check = run_checks(import_checks(), executor)
+    return check.verwaiste_importe
+
+def update_token_index():
+    """Öffnet den Token-Index und bringt ihn für alle durchsuchten Dateien auf den aktuellen Stand"""
+    index = TokenIndex(os.path.join(root_dir, index_file))
+    records = (record for record in walk_records(root_dir, should_skip_dir) if record.ext in extensions_to_search)
+    updated, removed = index.update(records, complete=True)
+    print(f"Token-Index: {updated} Dateien neu eingelesen, {removed} entfernt")
+    return index
+
+def query_token_index(patterns):
+    """Beantwortet Wortgrenzen-Suchen (z.B. \\bblog\\b) über den Token-Index statt über einen Scan"""
+    index = update_token_index()
+    try:
+        for pattern in patterns:
+            hits = index.search(pattern)
+            if hits is None:
+                print(f"\n{Fore.YELLOW}{pattern}: lässt sich nicht über den Index beantworten (nur Wortzeichen mit optionalem \\b){Style.RESET_ALL}")
+                continue
+
+            print(f"\n{Fore.CYAN}{pattern}: {sum(map(len, hits.values()))} Zeilen in {len(hits)} Dateien{Style.RESET_ALL}")
+            for path in sorted(hits):
+                print(f"  {Fore.YELLOW}Datei: {path}{Style.RESET_ALL}")
+                print(f"  Zeilen: {', '.join(map(str, hits[path]))}")
+    finally:
+        index.close()
+
+def parse_args():
+    """Liest die Kommandozeilen-Argumente"""
+    parser = argparse.ArgumentParser(description='Sucht nach verbliebenen Supabase- und Blog-Referenzen.')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='Anzahl paralleler Prozesse (0 = alle CPU-Kerne, Standard: 1)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Scan-Cache unter .cache/ weder lesen noch schreiben')
+    parser.add_argument('--importers', action='append', default=[], metavar='MODUL',
+                        help='Zeigt alle Dateien, die MODUL importieren (Alias wie @/lib/supabase oder Pfad, mehrfach möglich)')
+    parser.add_argument('--format', choices=['text', 'ndjson'], default='text',
+                        help='Ausgabeformat: farbiger Text oder NDJSON (ein JSON-Objekt pro Zeile) auf stdout')
+    parser.add_argument('--index-query', action='append', default=[], metavar='MUSTER',
+                        help='Sucht MUSTER (z.B. \\bblog\\b) über den inkrementellen Token-Index und beendet (mehrfach möglich)')
+    return parser.parse_args()
 
 def main():
     """Hauptfunktion zum Ausführen des Scripts"""
+    args = parse_args()
+    install_stdout()
+
+    if args.index_query:
+        query_token_index(args.index_query)
+        return
+
+    # Im NDJSON-Modus gehört stdout allein den Ergebnissen - Kopfzeilen und Warnungen gehen nach stderr
+    if args.format == 'ndjson':
+        reporter = NdjsonReporter(sys.stdout)
+        with contextlib.redirect_stdout(sys.stderr):
+            run(args, reporter)
+    else:
+        run(args, TextReporter(sys.stdout))
+
+def run(args, reporter):
+    """Führt alle Checks aus, gibt die Ergebnisse über den Reporter aus und gibt die Zusammenfassung zurück"""
     print(f"{Fore.CYAN}=============== SUPABASE & BLOG REFERENZ-CHECKER ==============={Style.RESET_ALL}")
     print(f"Python Version: {sys.version}")
     print(f"Arbeitsverzeichnis: {os.getcwd()}")
@@ -199,63 +369,63 @@ def main():
 
     print(f"{Fore.CYAN}Suche nach Referenzen...{Style.RESET_ALL}")
 
-    # Dateien scannen
-    start_time = __import__('time').time()
-    supabase_refs, blog_refs, total_files = scan_for_references()
-    end_time = __import__('time').time()
-
-    # Verwaiste Importe überprüfen
-    verwaiste_importe = check_verwaiste_importe()
-
-    # package.json überprüfen
-    supabase_packages = check_package_json()
+    # Scan-Cache öffnen - wird ungültig, sobald sich die Keyword-Listen ändern
+    cache = None
+    if not args.no_cache:
+        cache = ScanCache(os.path.join(root_dir, cache_file), cache_config)
+
+    # Alle Checks teilen sich einen Durchlauf: jede Datei wird höchstens einmal gelesen,
+    # Referenzen werden ausgegeben, sobald ihre Datei fertig ist
+    reference_check = ReferenceCheck(reporter)
+    *dependency_checks, import_check = import_checks()
+    package_check = PackageJsonCheck()
+
+    with create_executor(args.jobs) as executor:
+        start_time = __import__('time').time()
+        run_checks([reference_check, *dependency_checks, import_check, package_check], executor, cache)
+        end_time = __import__('time').time()
+
+    verwaiste_importe = import_check.verwaiste_importe
+    # Nicht auflösbare Importe, die nicht schon als verwaiste Importe gemeldet werden
+    gemeldet = {(imp['file'], imp['import']) for imp in verwaiste_importe}
+    unaufgeloeste_importe = [
+        imp for imp in import_check.unaufgeloeste_importe if (imp['file'], imp['import']) not in gemeldet
+    ]
+    supabase_packages = package_check.packages
 
     # Ergebnisse ausgeben
     print(f"\n{Fore.CYAN}============ SCAN-ERGEBNISSE ============{Style.RESET_ALL}")
     print(f"Dauer: {end_time - start_time:.2f} Sekunden")
-    print(f"Durchsuchte Dateien: {total_files}")
-
-    print(f"\n{Fore.CYAN}SUPABASE-REFERENZEN: {len(supabase_refs)}{Style.RESET_ALL}")
-    if supabase_refs:
-        for ref in supabase_refs:
-            print(f"\n{Fore.YELLOW}Datei: {ref['file']}{Style.RESET_ALL}")
-            for match in ref['matches']:
-                print(f"  Zeile {match['line_num']}: {match['line']}")
-    else:
-        print(f"{Fore.GREEN}Keine Supabase-Referenzen gefunden!{Style.RESET_ALL}")
-
-    print(f"\n{Fore.CYAN}BLOG-REFERENZEN: {len(blog_refs)}{Style.RESET_ALL}")
-    if blog_refs:
-        for ref in blog_refs:
-            print(f"\n{Fore.YELLOW}Datei: {ref['file']}{Style.RESET_ALL}")
-            for match in ref['matches']:
-                print(f"  Zeile {match['line_num']}: {match['line']}")
-    else:
-        print(f"{Fore.GREEN}Keine Blog-Referenzen gefunden!{Style.RESET_ALL}")
-
-    print(f"\n{Fore.CYAN}VERWAISTE IMPORTE: {len(verwaiste_importe)}{Style.RESET_ALL}")
-    if verwaiste_importe:
-        for imp in verwaiste_importe:
-            print(f"  {Fore.YELLOW}Datei: {imp['file']}{Style.RESET_ALL}")
-            print(f"  Import: {imp['import']}")
-    else:
-        print(f"{Fore.GREEN}Keine verwaisten Importe gefunden!{Style.RESET_ALL}")
-
-    print(f"\n{Fore.CYAN}SUPABASE-PAKETE IN PACKAGE.JSON: {len(supabase_packages)}{Style.RESET_ALL}")
-    if supabase_packages:
-        for package, version in supabase_packages:
-            print(f"  {Fore.YELLOW}{package}: {version}{Style.RESET_ALL}")
-    else:
-        print(f"{Fore.GREEN}Keine Supabase-Pakete in der package.json gefunden!{Style.RESET_ALL}")
-
-    print(f"\n{Fore.CYAN}================= ZUSAMMENFASSUNG ================={Style.RESET_ALL}")
-    if not supabase_refs and not blog_refs and not verwaiste_importe and not supabase_packages:
-        print(f"{Fore.GREEN}ERFOLG: Das Projekt wurde vollständig von Supabase und Blog-Referenzen bereinigt!{Style.RESET_ALL}")
-    else:
-        total_issues = len(supabase_refs) + len(blog_refs) + len(verwaiste_importe) + len(supabase_packages)
-        print(f"{Fore.YELLOW}ACHTUNG: Es wurden noch {total_issues} Probleme gefunden, die behoben werden müssen.{Style.RESET_ALL}")
-
-    print(f"{Fore.CYAN}====================================================={Style.RESET_ALL}")
+    print(f"Durchsuchte Dateien: {reference_check.total_files}")
+    if cache is not None:
+        print(f"Cache: {cache.hits} Treffer, {cache.misses} neu gescannt")
+        cache.close()
+
+    for group in keyword_matcher.groups:
+        reporter.report_reference_count(group, reference_check.file_counts[group], reference_check.match_counts[group])
+
+    reporter.report_imports('orphan_import', verwaiste_importe)
+    reporter.report_imports('unresolved_import', unaufgeloeste_importe)
+
+    for module in args.importers:
+        importers = import_check.graph.importers_of(module)
+        reporter.report_importers(module, {file.replace('/', os.sep): specifiers for file, specifiers in importers.items()})
+
+    reporter.report_packages(supabase_packages)
+
+    # Für die Zusammenfassung reichen die Zähler - die einzelnen Treffer sind längst ausgegeben
+    issues = sum(reference_check.file_counts.values()) + len(verwaiste_importe) + len(unaufgeloeste_importe) + len(supabase_packages)
+    summary = {
+        'files': reference_check.total_files,
+        'reference_files': reference_check.file_counts,
+        'reference_matches': reference_check.match_counts,
+        'orphan_imports': len(verwaiste_importe),
+        'unresolved_imports': len(unaufgeloeste_importe),
+        'packages': len(supabase_packages),
+        'issues': issues
+    }
+    reporter.report_summary(summary)
+    return summary
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,122 @@
+import sys
+import json
+
+from terminal_render import Fore, Style
+
+# Anzeigenamen der Keyword-Gruppen
+gruppen_namen = {
+    'supabase': 'Supabase',
+    'blog': 'Blog'
+}
+
+# Überschrift und Text ohne Befund je Art von Import-Problem
+import_abschnitte = {
+    'orphan_import': ('VERWAISTE IMPORTE', 'Keine verwaisten Importe gefunden!'),
+    'unresolved_import': ('UNAUFGELÖSTE IMPORTE', 'Keine unaufgelösten Importe gefunden!')
+}
+
+class ListReporter:
+    """Sammelt alle Referenzen in Listen - nur für Aufrufer, die die Treffer selbst weiterverarbeiten"""
+
+    def __init__(self):
+        self.references = {group: [] for group in gruppen_namen}
+
+    def report_references(self, group, file, matches):
+        self.references.setdefault(group, []).append({'file': file, 'matches': matches})
+
+class TextReporter:
+    """Farbige Konsolenausgabe: Referenzen erscheinen, sobald eine Datei fertig ist, der Rest am Ende"""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def _print(self, text=''):
+        print(text, file=self.stream)
+
+    def report_references(self, group, file, matches):
+        """Gibt die Treffer einer Datei sofort aus"""
+        self._print(f"\n{Fore.YELLOW}Datei: {file} [{gruppen_namen.get(group, group)}]{Style.RESET_ALL}")
+        for match in matches:
+            self._print(f"  Zeile {match['line_num']}: {match['line']}")
+        self.stream.flush()
+
+    def report_reference_count(self, group, file_count, match_count):
+        """Gibt die Anzahl der Dateien (und Treffer) einer Gruppe aus"""
+        title = f"{gruppen_namen.get(group, group).upper()}-REFERENZEN"
+        self._print(f"\n{Fore.CYAN}{title}: {file_count}{Style.RESET_ALL}")
+        if file_count:
+            self._print(f"  {Fore.YELLOW}{match_count} Treffer in {file_count} Dateien{Style.RESET_ALL}")
+        else:
+            self._print(f"{Fore.GREEN}Keine {gruppen_namen.get(group, group)}-Referenzen gefunden!{Style.RESET_ALL}")
+
+    def report_imports(self, kind, imports):
+        """Gibt eine Liste von Importen ({'file', 'import'}) als Abschnitt aus"""
+        title, empty_text = import_abschnitte[kind]
+        self._print(f"\n{Fore.CYAN}{title}: {len(imports)}{Style.RESET_ALL}")
+        if imports:
+            for imp in imports:
+                self._print(f"  {Fore.YELLOW}Datei: {imp['file']}{Style.RESET_ALL}")
+                self._print(f"  Import: {imp['import']}")
+        else:
+            self._print(f"{Fore.GREEN}{empty_text}{Style.RESET_ALL}")
+
+    def report_importers(self, module, importers):
+        """Gibt alle Dateien aus, die ein Modul importieren"""
+        self._print(f"\n{Fore.CYAN}DATEIEN, DIE {module} IMPORTIEREN: {len(importers)}{Style.RESET_ALL}")
+        for file, specifiers in importers.items():
+            self._print(f"  {Fore.YELLOW}Datei: {file}{Style.RESET_ALL}")
+            self._print(f"  Import: {', '.join(specifiers)}")
+
+    def report_packages(self, packages):
+        """Gibt die Supabase-Pakete aus der package.json aus"""
+        self._print(f"\n{Fore.CYAN}SUPABASE-PAKETE IN PACKAGE.JSON: {len(packages)}{Style.RESET_ALL}")
+        if packages:
+            for package, version in packages:
+                self._print(f"  {Fore.YELLOW}{package}: {version}{Style.RESET_ALL}")
+        else:
+            self._print(f"{Fore.GREEN}Keine Supabase-Pakete in der package.json gefunden!{Style.RESET_ALL}")
+
+    def report_summary(self, summary):
+        """Gibt die Zusammenfassung aus"""
+        self._print(f"\n{Fore.CYAN}================= ZUSAMMENFASSUNG ================={Style.RESET_ALL}")
+        if not summary['issues']:
+            self._print(f"{Fore.GREEN}ERFOLG: Das Projekt wurde vollständig von Supabase und Blog-Referenzen bereinigt!{Style.RESET_ALL}")
+        else:
+            self._print(f"{Fore.YELLOW}ACHTUNG: Es wurden noch {summary['issues']} Probleme gefunden, die behoben werden müssen.{Style.RESET_ALL}")
+
+        self._print(f"{Fore.CYAN}====================================================={Style.RESET_ALL}")
+
+class NdjsonReporter:
+    """Ein JSON-Objekt pro Zeile (NDJSON) zum Weiterverarbeiten mit anderen Tools; jede Zeile hat ein Feld "type" """
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def _emit(self, record):
+        self.stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def report_references(self, group, file, matches):
+        """Eine Zeile pro Treffer, sofort nach der Datei geschrieben"""
+        for match in matches:
+            self._emit({'type': 'reference', 'group': group, 'file': file, **match})
+        self.stream.flush()
+
+    def report_reference_count(self, group, file_count, match_count):
+        # Die Anzahlen stehen in der Zusammenfassung
+        pass
+
+    def report_imports(self, kind, imports):
+        for imp in imports:
+            self._emit({'type': kind, 'file': imp['file'], 'import': imp['import']})
+
+    def report_importers(self, module, importers):
+        for file, specifiers in importers.items():
+            self._emit({'type': 'importer', 'module': module, 'file': file, 'imports': specifiers})
+
+    def report_packages(self, packages):
+        for package, version in packages:
+            self._emit({'type': 'package', 'package': package, 'version': version})
+
+    def report_summary(self, summary):
+        self._emit({'type': 'summary', **summary})
+        self.stream.flush()
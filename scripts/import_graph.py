@@ -0,0 +1,210 @@
+import os
+import re
+import json
+import posixpath
+
+# Alle Formen, mit denen ein Modul referenziert wird:
+#   import x from '...'   import '...'   export { x } from '...'   import('...')   require('...')
+# Mehrzeilige Import-Listen werden über das abschließende "from '...'" erfasst. Strings, Template-Literale
+# und Kommentare passen als Ganzes auf die übrigen Alternativen und werden so übersprungen - ein import
+# oder require darin (auskommentiert, in Doku-Strings oder Code-Generatoren) zählt nicht.
+specifier_pattern = re.compile(
+    r'''(?:from\s*|import\s*(?:\(\s*)?|require\s*\(\s*)(['"])([^'"\n]+)\1'''
+    r'''|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`|//[^\n]*|/\*.*?\*/''',
+    re.DOTALL
+)
+# Ein Treffer zählt nur, wenn das Schlüsselwort nicht Teil eines längeren Bezeichners ist (z.B. "reimport")
+identifier_char = re.compile(r'[\w$]')
+
+# Endungen, die beim Auflösen eines Modulpfads der Reihe nach probiert werden
+resolve_extensions = ['.ts', '.tsx', '.d.ts', '.js', '.jsx', '.json']
+
+def extract_specifiers(text):
+    """Gibt alle Modul-Spezifizierer einer Datei in Reihenfolge ihres Auftretens zurück"""
+    return [
+        match.group(2) for match in specifier_pattern.finditer(text)
+        if match.group(2) is not None and not (match.start() and identifier_char.match(text, match.start() - 1))
+    ]
+
+def strip_json_comments(text):
+    """Entfernt Kommentare und nachgestellte Kommas aus JSONC (tsconfig.json), Strings bleiben unverändert"""
+    text = re.sub(r'"(?:\\.|[^"\\])*"|//[^\n]*|/\*.*?\*/',
+                  lambda match: match.group(0) if match.group(0).startswith('"') else '',
+                  text, flags=re.DOTALL)
+    return re.sub(r',(\s*[}\]])', r'\1', text)
+
+def parse_path_aliases(text):
+    """Liest baseUrl und paths aus dem Inhalt einer tsconfig.json (None, wenn sie sich nicht parsen lässt)"""
+    try:
+        config = json.loads(text)
+    except ValueError:
+        try:
+            config = json.loads(strip_json_comments(text))
+        except ValueError:
+            return None
+
+    options = config.get('compilerOptions', {})
+    return {
+        'baseUrl': options.get('baseUrl', '.'),
+        'paths': options.get('paths', {})
+    }
+
+class ImportGraph:
+    """Adjazenz-Index aller Importe: Datei -> Spezifizierer -> aufgelöste Datei.
+
+    Wird einmal aus den extrahierten Spezifizierern aufgebaut; Abfragen wie "wer importiert
+    @/lib/supabase?" oder "welche Importe lassen sich nicht auflösen?" sind danach reine Lookups.
+    """
+
+    def __init__(self, root_dir, aliases=None, known_files=None):
+        self.root_dir = root_dir
+        self.known_files = set(known_files or ())
+        self.aliases = []
+
+        # Alias-Muster wie TypeScript nach Länge des Präfixes sortieren - das längste passende gewinnt
+        aliases = aliases or {'baseUrl': '.', 'paths': {}}
+        base_url = posixpath.normpath(aliases['baseUrl'].replace('\\', '/'))
+        for pattern, targets in aliases['paths'].items():
+            prefix, _, suffix = pattern.partition('*')
+            targets = [posixpath.normpath(posixpath.join(base_url, target)) for target in targets]
+            self.aliases.append((prefix, suffix, '*' in pattern, targets))
+        self.aliases.sort(key=lambda alias: len(alias[0]), reverse=True)
+
+        # Datei -> [(Spezifizierer, aufgelöster Pfad oder None)], Datei -> Position im Durchlauf
+        self.edges = {}
+        self.order = {}
+        # Spezifizierer -> [Dateien], aufgelöster Pfad -> [Dateien]
+        self.by_specifier = {}
+        self.by_target = {}
+        self._resolved = {}
+        self._local = {}
+
+    def add_file(self, rel_path, specifiers):
+        """Nimmt die Spezifizierer einer Datei in den Index auf"""
+        rel_path = rel_path.replace(os.sep, '/')
+        self.known_files.add(rel_path)
+        self.order.setdefault(rel_path, len(self.order))
+        self.edges[rel_path] = [(specifier, None) for specifier in specifiers]
+        for specifier in dict.fromkeys(specifiers):
+            self.by_specifier.setdefault(specifier, []).append(rel_path)
+
+    def _exists(self, rel_path):
+        """Bekannte Dateien aus dem Durchlauf zuerst, nur sonst ein Dateisystemzugriff"""
+        if rel_path in self.known_files:
+            return True
+        return os.path.isfile(os.path.join(self.root_dir, *rel_path.split('/')))
+
+    def _resolve_candidates(self, base):
+        """Probiert einen Pfad direkt, mit Endungen und als Verzeichnis mit index-Datei"""
+        candidates = [base] + [base + ext for ext in resolve_extensions]
+        candidates += [posixpath.join(base, 'index' + ext) for ext in resolve_extensions]
+        for candidate in candidates:
+            if self._exists(candidate):
+                return candidate
+        return None
+
+    def is_local(self, specifier):
+        """Relativer Pfad oder Alias aus tsconfig.json (keine npm-Pakete)"""
+        local = self._local.get(specifier)
+        if local is None:
+            local = specifier.startswith(('./', '../')) or specifier in ('.', '..') or any(
+                specifier.startswith(prefix) and specifier.endswith(suffix) if wildcard else specifier == prefix
+                for prefix, suffix, wildcard, _ in self.aliases
+            )
+            self._local[specifier] = local
+        return local
+
+    def resolve(self, importer, specifier):
+        """Löst einen Spezifizierer relativ zur importierenden Datei auf (None, wenn nicht möglich)"""
+        if specifier.startswith(('./', '../')) or specifier in ('.', '..'):
+            key = (posixpath.dirname(importer), specifier)
+            if key not in self._resolved:
+                base = posixpath.normpath(posixpath.join(key[0], specifier))
+                self._resolved[key] = self._resolve_candidates(base)
+            return self._resolved[key]
+
+        key = ('', specifier)
+        if key not in self._resolved:
+            self._resolved[key] = None
+            for prefix, suffix, wildcard, targets in self.aliases:
+                if wildcard:
+                    if not (specifier.startswith(prefix) and specifier.endswith(suffix)):
+                        continue
+                    matched = specifier[len(prefix):len(specifier) - len(suffix)]
+                elif specifier != prefix:
+                    continue
+                else:
+                    matched = ''
+
+                for target in targets:
+                    resolved = self._resolve_candidates(target.replace('*', matched))
+                    if resolved:
+                        self._resolved[key] = resolved
+                        break
+                # Wie bei TypeScript zählt nur das Muster mit dem längsten Präfix
+                break
+        return self._resolved[key]
+
+    def build(self):
+        """Löst alle Kanten auf und baut den Rückwärts-Index (Ziel -> importierende Dateien)"""
+        self.by_target = {}
+        for importer, edges in self.edges.items():
+            resolved_edges = []
+            for specifier, _ in edges:
+                target = self.resolve(importer, specifier) if self.is_local(specifier) else None
+                resolved_edges.append((specifier, target))
+                if target is not None:
+                    importers = self.by_target.setdefault(target, [])
+                    if not importers or importers[-1] != importer:
+                        importers.append(importer)
+            self.edges[importer] = resolved_edges
+        return self
+
+    def importers_of(self, module):
+        """Wer importiert ein Modul? Akzeptiert einen Spezifizierer-Präfix (@/lib/supabase) oder einen Dateipfad"""
+        module = module.replace(os.sep, '/')
+        importers = {}
+
+        # Spezifizierer-Index: derselbe Spezifizierer oder ein Untermodul davon
+        for specifier, files in self.by_specifier.items():
+            if specifier == module or specifier.startswith(module.rstrip('/') + '/'):
+                for file in files:
+                    importers.setdefault(file, []).append(specifier)
+
+        # Rückwärts-Index über die aufgelöste Datei - findet auch relative Importe
+        if self.is_local(module):
+            target = self.resolve('', module)
+        else:
+            target = self._resolve_candidates(posixpath.normpath(module))
+        for file in self.by_target.get(target, []):
+            importers.setdefault(file, []).extend(
+                specifier for specifier, resolved in self.edges[file] if resolved == target
+            )
+
+        return {file: list(dict.fromkeys(specifiers)) for file, specifiers in importers.items()}
+
+    def imports_with_prefix(self, prefixes):
+        """Gibt alle (Datei, Spezifizierer) zurück, deren Spezifizierer mit einem der Präfixe beginnt.
+
+        Sortiert nach Durchlauf-Reihenfolge der Dateien, je Datei nach Präfix und Position im Quelltext;
+        nur Dateien mit Treffern aus dem Spezifizierer-Index werden betrachtet.
+        """
+        prefixes = list(prefixes)
+        matching = [specifier for specifier in self.by_specifier if specifier.startswith(tuple(prefixes))]
+        files = {file for specifier in matching for file in self.by_specifier[specifier]}
+        return [
+            (file, specifier)
+            for file in sorted(files, key=self.order.get)
+            for prefix in prefixes
+            for specifier, _ in self.edges[file]
+            if specifier.startswith(prefix)
+        ]
+
+    def unresolved(self):
+        """Gibt alle lokalen Importe (relativ oder Alias) zurück, die auf keine Datei zeigen"""
+        return [
+            (importer, specifier)
+            for importer, edges in self.edges.items()
+            for specifier, target in edges
+            if target is None and self.is_local(specifier)
+        ]
@@ -0,0 +1,106 @@
+from array import array
+
+class Match:
+    """Ein einzelner Treffer - wird erst beim Zugriff aus den Spalten einer MatchList erzeugt.
+
+    Verhält sich beim Lesen wie das bisherige Dict: match['line_num'], dict(match), **match.
+    """
+
+    __slots__ = ('line_num', 'term', 'line')
+
+    def __init__(self, line_num, term, line):
+        self.line_num = line_num
+        self.term = term
+        self.line = line
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def keys(self):
+        return self.__slots__
+
+    def __eq__(self, other):
+        if isinstance(other, (Match, dict)):
+            return dict(self) == dict(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Match(line_num={self.line_num!r}, term={self.term!r}, line={self.line!r})"
+
+class MatchList:
+    """Spaltenweise Trefferliste einer Keyword-Gruppe.
+
+    Pro Treffer werden nur zwei kleine Zahlen gespeichert (Index der Trefferzeile in array('I'),
+    Index des Begriffs in der Keyword-Tabelle in array('H')). Zeilennummer und Zeilentext liegen
+    einmal pro Trefferzeile vor - mehrere Begriffe in derselben Zeile teilen sich den Text.
+    """
+
+    __slots__ = ('terms', 'rows_line', 'rows_term', 'line_nums', 'lines')
+
+    def __init__(self, terms):
+        self.terms = tuple(terms)
+        self.rows_line = array('I')
+        self.rows_term = array('H')
+        self.line_nums = array('I')
+        self.lines = []
+
+    def append(self, line_num, term_id, line):
+        """Fügt einen Treffer an - Treffer einer Zeile kommen direkt hintereinander"""
+        if not self.line_nums or self.line_nums[-1] != line_num:
+            self.line_nums.append(line_num)
+            self.lines.append(line)
+        self.rows_line.append(len(self.line_nums) - 1)
+        self.rows_term.append(term_id)
+
+    def __len__(self):
+        return len(self.rows_term)
+
+    def __getitem__(self, index):
+        line_id = self.rows_line[index]
+        return Match(self.line_nums[line_id], self.terms[self.rows_term[index]], self.lines[line_id])
+
+    def __iter__(self):
+        terms, line_nums, lines = self.terms, self.line_nums, self.lines
+        for line_id, term_id in zip(self.rows_line, self.rows_term):
+            yield Match(line_nums[line_id], terms[term_id], lines[line_id])
+
+    def __eq__(self, other):
+        if isinstance(other, (MatchList, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"MatchList({list(self)!r})"
+
+    def to_json(self):
+        """Kompakte, JSON-taugliche Darstellung (für den Scan-Cache)"""
+        return {
+            '__matches__': [
+                list(self.terms), self.rows_line.tolist(), self.rows_term.tolist(),
+                self.line_nums.tolist(), self.lines
+            ]
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        terms, rows_line, rows_term, line_nums, lines = data['__matches__']
+        matches = cls(terms)
+        matches.rows_line.fromlist(rows_line)
+        matches.rows_term.fromlist(rows_term)
+        matches.line_nums.fromlist(line_nums)
+        matches.lines = lines
+        return matches
+
+def encode_result(value):
+    """default-Hook für json.dumps: kodiert MatchList-Objekte"""
+    if isinstance(value, MatchList):
+        return value.to_json()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def decode_result(data):
+    """object_hook für json.loads: stellt MatchList-Objekte wieder her"""
+    if '__matches__' in data:
+        return MatchList.from_json(data)
+    return data
@@ -1,27 +1,206 @@
 import os
 import re
 import sys
+import io
+import json
+import asyncio
+import argparse
+from collections import deque
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 
-def extract_file_paths(lint_output):
-    """Extrahiert die Dateipfade aus der ESLint-Ausgabe."""
-    pattern = r'\./(.+?)\n'
-    return re.findall(pattern, lint_output)
+from terminal_render import Fore, Style, BufferedOutput, install_stdout, render_lines
 
-def read_file_content(base_path, relative_path):
-    """Liest den Inhalt einer Datei aus."""
+# Anzahl der Dateien, die gleichzeitig gelesen werden (über WSL/9P dominiert die Latenz pro Datei)
+READ_CONCURRENCY = 16
+
+# Blockgröße beim Einlesen der JSON-Ausgabe von ESLint
+JSON_CHUNK_SIZE = 64 * 1024
+
+# ESLint-Meldung im stylish-Format: "19:18  Warning: ..." (Next.js) bzw. "  19:18  warning  ..." (ESLint)
+diagnostic_pattern = re.compile(r'^\s*(\d+):\d+\s')
+
+# Dateikopf im stylish-Format: ein nicht eingerückter Pfad mit Dateiendung ("./src/a.tsx", "/home/x/a.ts", "C:\\x\\a.ts")
+file_header_pattern = re.compile(r'^\S.*[\\/][^\\/\s]+\.\w+$')
+
+def parse_stylish(lines):
+    """Liest die stylish-Ausgabe zeilenweise und liefert (Dateipfad, Zeilennummern), sobald der Block einer Datei endet."""
+    path = None
+    line_nums = []
+    for line in lines:
+        line = line.rstrip('\r\n')
+        match = diagnostic_pattern.match(line)
+        if match:
+            if path is not None:
+                line_nums.append(int(match.group(1)))
+        elif file_header_pattern.match(line.rstrip()):
+            if path is not None:
+                yield path, line_nums
+            path, line_nums = line.rstrip(), []
+        elif not line.strip() and path is not None:
+            # Leerzeile beendet den Block - die Datei kann schon gelesen werden
+            yield path, line_nums
+            path, line_nums = None, []
+    if path is not None:
+        yield path, line_nums
+
+def parse_json(stream, buffer='', chunk_size=JSON_CHUNK_SIZE):
+    """Liest die JSON-Ausgabe (--format json) blockweise und liefert (Dateipfad, Zeilennummern) je Datei-Objekt,
+    ohne das ganze Array im Speicher zu halten. Dateien ohne Meldungen werden übersprungen."""
+    decoder = json.JSONDecoder()
+    needed = 0
+    eof = False
+    while True:
+        buffer = buffer.lstrip(' \t\r\n,[')
+        if buffer.startswith(']'):
+            return
+        if buffer and (eof or len(buffer) >= needed):
+            try:
+                result, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                # Objekt noch unvollständig - erst bei doppelter Puffergröße erneut versuchen
+                needed = 2 * len(buffer)
+            else:
+                buffer = buffer[end:]
+                needed = 0
+                messages = result.get('messages') or []
+                if messages:
+                    yield result.get('filePath', ''), [message['line'] for message in messages if message.get('line')]
+                continue
+        elif eof:
+            return
+
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        buffer += chunk
+
+def iter_lint_files(stream, lint_format='auto'):
+    """Liefert (Dateipfad, Zeilennummern) je Datei aus einer ESLint-Ausgabe - stylish oder JSON (auto: am ersten Zeichen erkannt)."""
+    first = ''
+    if lint_format == 'auto':
+        while True:
+            first = stream.readline()
+            if not first or first.strip():
+                break
+        lint_format = 'json' if first.lstrip().startswith('[') else 'stylish'
+
+    if lint_format == 'json':
+        return parse_json(stream, first)
+    return parse_stylish(chain([first], stream))
+
+def normalize_path(base_path, file_path):
+    """Macht einen ESLint-Pfad relativ zum Projekt ("./src/a.tsx" bzw. absolut -> "src/a.tsx")."""
+    if os.path.isabs(file_path):
+        try:
+            rel_path = os.path.relpath(file_path, base_path)
+        except ValueError:
+            # Unter Windows: anderes Laufwerk als das Projekt
+            rel_path = '..'
+        if not rel_path.startswith('..'):
+            file_path = rel_path
+    if file_path.startswith('./'):
+        file_path = file_path[2:]
+    return file_path.replace(os.sep, '/')
+
+def full_path_for(base_path, relative_path):
+    """Setzt den vollständigen Pfad aus Projektpfad und ESLint-Pfad zusammen."""
     # Konvertiere ./ zum relativen Pfad
     if relative_path.startswith('./'):
         relative_path = relative_path[2:]
+    return os.path.join(base_path, relative_path)
+
+def print_context(out, lines, line_nums, context):
+    """Gibt nur die gemeldeten Zeilen ±context aus."""
+    marks = {i: f"{Fore.YELLOW}{i:4} [ESLINT]{Style.RESET_ALL} " for i in line_nums}
+    render_lines(out, lines, marks, context)
 
-    full_path = os.path.join(base_path, relative_path)
+def read_file(full_path):
+    """Liest eine Datei und gibt (Inhalt, Fehler) zurück."""
     try:
         with open(full_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        return content
+            return file.read(), None
     except Exception as e:
-        return f"Fehler beim Lesen der Datei {full_path}: {str(e)}"
+        return None, e
+
+def read_file_content(base_path, relative_path):
+    """Liest den Inhalt einer Datei aus."""
+    full_path = full_path_for(base_path, relative_path)
+    content, error = read_file(full_path)
+    if error:
+        return f"Fehler beim Lesen der Datei {full_path}: {str(error)}"
+    return content
+
+def print_file(out, base_path, file_path, content, error, line_nums, context):
+    """Gibt eine Datei mit Kopfzeile aus - ganz oder mit context nur die gemeldeten Zeilen."""
+    out.line("\n" + "=" * 80)
+    out.line(f"DATEI: {file_path}")
+    out.line("=" * 80)
+    if error:
+        out.line(f"Fehler beim Lesen der Datei {full_path_for(base_path, file_path)}: {str(error)}")
+    elif context is None:
+        out.line(content)
+    else:
+        print_context(out, content.splitlines(), line_nums, context)
+
+async def print_files(out, base_path, lint_files, context, concurrency=READ_CONCURRENCY, sort=True):
+    """Liest die ESLint-Ausgabe in einem Thread und startet für jede gemeldete Datei sofort das Lesen
+    (höchstens concurrency gleichzeitig) - noch bevor die Ausgabe vollständig ist.
+
+    Mit sort erscheinen die Dateien sortiert, sobald die ESLint-Ausgabe zu Ende ist; ohne sort in
+    Eingangs-Reihenfolge, und es liegen nie mehr als concurrency Dateien im Speicher.
+    """
+    loop = asyncio.get_running_loop()
+    diagnostics = {}
+    pending = deque()
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        while True:
+            item = await loop.run_in_executor(None, next, lint_files, None)
+            if item is None:
+                break
+
+            file_path, line_nums = item
+            file_path = normalize_path(base_path, file_path)
+            if file_path in diagnostics:
+                # Doppelte Blöcke werden zusammengeführt, die Datei nur einmal gelesen
+                diagnostics[file_path].update(line_nums)
+                continue
+
+            diagnostics[file_path] = set(line_nums)
+            full_path = full_path_for(base_path, file_path)
+            pending.append((file_path, loop.run_in_executor(executor, read_file, full_path)))
+
+            while not sort and pending and (pending[0][1].done() or len(pending) > concurrency):
+                file_path, read = pending.popleft()
+                print_file(out, base_path, file_path, *await read, diagnostics[file_path], context)
+
+        if sort:
+            pending = deque(sorted(pending, key=lambda item: item[0]))
+        while pending:
+            file_path, read = pending.popleft()
+            print_file(out, base_path, file_path, *await read, diagnostics[file_path], context)
+
+def parse_args():
+    """Liest die Kommandozeilen-Argumente"""
+    parser = argparse.ArgumentParser(description='Gibt die Dateien aus der ESLint-Ausgabe zum Korrigieren aus.')
+    parser.add_argument('--context', type=int, metavar='N',
+                        help='Nur die gemeldeten Zeilen mit N Zeilen Kontext statt der ganzen Datei anzeigen')
+    parser.add_argument('--concurrency', type=int, default=READ_CONCURRENCY, metavar='N',
+                        help=f'Anzahl der Dateien, die gleichzeitig gelesen werden (Standard: {READ_CONCURRENCY})')
+    parser.add_argument('--input', '-i', metavar='DATEI',
+                        help='ESLint-Ausgabe aus DATEI lesen ("-" = stdin; ohne Angabe: eingebaute Beispielausgabe)')
+    parser.add_argument('--lint-format', choices=['auto', 'stylish', 'json'], default='auto',
+                        help='Format der ESLint-Ausgabe (Standard: auto)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Dateien in Eingangs-Reihenfolge ausgeben, ohne auf das Ende der ESLint-Ausgabe zu warten')
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
+    install_stdout()
+
     # Projektpfad
     base_path = r"C:\Users\damja\WebstormProjects\RitterDigitalSite"
 
@@ -119,22 +298,18 @@ def main():
 ./src/types/forms.ts
 133:22  Warning: Unexpected any. Specify a different type.  @typescript-eslint/no-explicit-any"""
 
-    # Extrahiere die Dateipfade
-    file_paths = extract_file_paths(lint_output)
-
-    # Entferne Duplikate
-    file_paths = list(set(file_paths))
-
-    # Sortiere die Dateipfade für eine bessere Lesbarkeit
-    file_paths.sort()
+    # ESLint-Ausgabe aus stdin, einer Datei oder dem eingebauten Beispiel - zeilen- bzw. blockweise gelesen
+    if args.input == '-':
+        lint_stream = sys.stdin
+    elif args.input:
+        lint_stream = open(args.input, 'r', encoding='utf-8')
+    else:
+        lint_stream = io.StringIO(lint_output)
 
-    # Gib den Inhalt jeder Datei aus
-    for file_path in file_paths:
-        print("\n" + "=" * 80)
-        print(f"DATEI: {file_path}")
-        print("=" * 80)
-        content = read_file_content(base_path, file_path)
-        print(content)
+    # Gib den Inhalt jeder Datei aus - gleichzeitig gelesen und in großen Blöcken geschrieben
+    with lint_stream, BufferedOutput() as out:
+        lint_files = iter_lint_files(lint_stream, args.lint_format)
+        asyncio.run(print_files(out, base_path, lint_files, args.context, args.concurrency, sort=not args.stream))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,10 +1,15 @@
 import os
 import sys
 import re
-from colorama import init, Fore, Style
+import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-# Initialisiere colorama für farbige Ausgabe
-init()
+from scan_engine import KeywordMatcher, FileRecord, create_executor
+from snapshot_store import SnapshotStore
+from token_index import TokenIndex, parse_query
+from terminal_render import Fore, Style, BufferedOutput, install_stdout, render_lines
+from rewrite_engine import rewrite_files, removal_diff, removal_patch
 
 # Stammverzeichnis des Projekts
 root_dir = r'C:\Users\damja\WebstormProjects\RitterDigitalSite'
@@ -95,62 +100,239 @@ blog_patterns = [
     r'LatestBlogPosts'
 ]
 
-def create_backup(file_path):
-    """Erstellt eine Sicherungskopie der Datei"""
-    backup_path = f"{file_path}.bak"
+# Beide Mustergruppen in einem vorkompilierten Matcher - ein Durchlauf über den ganzen Dateiinhalt
+pattern_matcher = KeywordMatcher({
+    'supabase': supabase_patterns,
+    'blog': blog_patterns
+})
+
+# Für --index: Blog-Muster mit Wortgrenzen kommen aus dem Token-Index, nur der Rest wird noch durchsucht
+index_rest_matcher = KeywordMatcher({
+    'supabase': supabase_patterns,
+    'blog': [pattern for pattern in blog_patterns if parse_query(pattern) is None]
+})
+
+# Dieselben Muster einzeln vorkompiliert für den zeilenweisen Fallback
+supabase_regexe = [re.compile(pattern, re.IGNORECASE) for pattern in supabase_patterns]
+blog_regexe = [re.compile(pattern, re.IGNORECASE) for pattern in blog_patterns]
+
+# Sicherungen (Snapshots) relativ zum Stammverzeichnis
+snapshot_dir = os.path.join('.cache', 'snapshots')
+
+# Token-Index relativ zum Stammverzeichnis (gemeinsam mit check_cleanup)
+index_file = os.path.join('.cache', 'token_index.sqlite')
+
+# Anzahl der Dateien, die im Hintergrund vorab gelesen und klassifiziert werden
+PREFETCH_WINDOW = 4
+
+# Markierung je Zeile als Bitmaske
+SUPABASE = 1
+BLOG = 2
+
+# Zeichen, an denen str.splitlines() zusätzlich zu \n eine Zeile beendet
+weitere_zeilentrenner = re.compile('[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+
+def classify_lines(content, lines, blog_hits=None):
+    """Gibt für jede Zeile (0-basiert) eine Markierung aus SUPABASE/BLOG-Bits als bytearray zurück.
+
+    blog_hits sind die Blog-Trefferzeilen aus dem Token-Index - dann werden nur noch die
+    nicht indexierbaren Muster über den Inhalt gesucht.
+    """
+    flags = bytearray(len(lines))
+
+    if weitere_zeilentrenner.search(content):
+        # Seltener Fall: Zeilen wie bisher aus splitlines() einzeln prüfen
+        for i, line in enumerate(lines):
+            if any(regex.search(line) for regex in supabase_regexe):
+                flags[i] |= SUPABASE
+            if any(regex.search(line) for regex in blog_regexe):
+                flags[i] |= BLOG
+        return flags
+
+    if blog_hits is not None:
+        for line_num in blog_hits:
+            if line_num <= len(flags):
+                flags[line_num - 1] |= BLOG
+        results = index_rest_matcher.scan_text(content)
+    else:
+        # Muster einmal über den ganzen Inhalt, Zeilennummern nur für Treffer
+        results = pattern_matcher.scan_text(content)
+    for line_num in results['supabase'].line_nums:
+        flags[line_num - 1] |= SUPABASE
+    for line_num in results['blog'].line_nums:
+        flags[line_num - 1] |= BLOG
+    return flags
+
+class FileAnalysis:
+    """Liest eine Datei einmal und klassifiziert jede Zeile einmal - Anzeige, Zählung und
+    die zu entfernenden Zeilen leiten sich alle aus dieser Klassifizierung ab"""
+
+    def __init__(self, file_path, blog_hits=None):
+        self.file_path = file_path
+        self.lines = []
+        self.flags = bytearray()
+        self.error = None
+
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                content = file.read()
+        except Exception as e:
+            self.error = e
+            return
+
+        self.lines = content.splitlines()
+        self.flags = classify_lines(content, self.lines, blog_hits)
+        self.final_newline = content.endswith(('\n', '\r'))
+
+    def tagged_lines(self):
+        """Gibt (Zeilennummer, Markierung, Zeile) für alle Zeilen zurück"""
+        return zip(range(1, len(self.lines) + 1), self.flags, self.lines)
+
+    def lines_with(self, flag):
+        """Gibt die Nummern aller Zeilen mit der Markierung aufsteigend zurück"""
+        return [i for i, flags in enumerate(self.flags, 1) if flags & flag]
+
+    @property
+    def supabase_lines(self):
+        return self.lines_with(SUPABASE)
+
+    @property
+    def blog_lines(self):
+        return self.lines_with(BLOG)
+
+    @property
+    def drop_lines(self):
+        """Nummern aller markierten Zeilen - diese Zeilen entfernen --apply und --diff"""
+        return [i for i, flags in enumerate(self.flags, 1) if flags]
+
+    def patch(self, rel_path, context=3):
+        """Unified Diff, der alle markierten Zeilen entfernt - aus derselben Klassifizierung wie die Anzeige"""
+        drop = self.drop_lines
+        return removal_patch(rel_path, self.lines, drop, context, self.final_newline), len(drop)
+
+def load_analysis(file_path, blog_hits=None):
+    """Liest und klassifiziert eine Datei - None, wenn sie nicht existiert (läuft im Thread-Pool)"""
+    if not os.path.exists(file_path):
+        return None
+    return FileAnalysis(file_path, blog_hits)
+
+def prefetch(function, items, window=PREFETCH_WINDOW):
+    """Wendet function in einem Thread-Pool vorausschauend auf die Elemente an und gibt (Element, Ergebnis)
+    in Eingabe-Reihenfolge zurück. Höchstens window Elemente sind gleichzeitig in Arbeit oder
+    warten auf die Ausgabe - der Speicherbedarf bleibt unabhängig von der Anzahl der Dateien."""
+    if window <= 0:
+        for item in items:
+            yield item, function(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=window) as executor:
+        pending = deque()
+        for item in items:
+            pending.append((item, executor.submit(function, item)))
+            if len(pending) >= window:
+                item, future = pending.popleft()
+                yield item, future.result()
+
+        while pending:
+            item, future = pending.popleft()
+            yield item, future.result()
+
+def prefetch_analyses(file_paths, window=PREFETCH_WINDOW, blog_hits=None):
+    """Liest und klassifiziert die Dateien vorab im Thread-Pool, Ausgabe in Eingabe-Reihenfolge.
+    blog_hits ({Pfad: Zeilen} aus dem Token-Index) ersetzt die Suche nach den indexierbaren Blog-Mustern."""
+    if blog_hits is None:
+        return prefetch(load_analysis, file_paths, window)
+    return prefetch(lambda file_path: load_analysis(file_path, blog_hits.get(file_path, ())), file_paths, window)
+
+def index_blog_hits():
+    """Aktualisiert den Token-Index für die zu bereinigenden Dateien und gibt {Pfad: Blog-Zeilen} zurück"""
+    records = {
+        os.path.normpath(rel_path): FileRecord(os.path.join(root_dir, rel_path), os.path.normpath(rel_path))
+        for rel_path in files_to_clean
+    }
+    index = TokenIndex(os.path.join(root_dir, index_file))
+    try:
+        updated, _ = index.update(records.values())
+        hits, _ = index.search_all(blog_patterns)
+    finally:
+        index.close()
+
+    print(f"Token-Index: {updated} Dateien neu eingelesen")
+    return {records[rel_path].path: lines for rel_path, lines in hits.items() if rel_path in records}
+
+def build_patch(rel_path):
+    """Klassifiziert eine Datei und erzeugt ihren Patch - (Patch, Anzahl entfernter Zeilen, Fehler); läuft im Thread-Pool"""
+    file_path = os.path.join(root_dir, rel_path)
+    if not os.path.exists(file_path):
+        return '', 0, FileNotFoundError(f"Datei nicht gefunden: {rel_path}")
+
+    analysis = FileAnalysis(file_path)
+    if analysis.error:
+        return '', 0, analysis.error
+    return (*analysis.patch(rel_path), None)
+
+def create_backup(rel_paths=None):
+    """Sichert alle zu bereinigenden Dateien in einem Snapshot und gibt dessen ID zurück (None bei Fehlern)"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as src:
-            with open(backup_path, 'w', encoding='utf-8') as dst:
-                dst.write(src.read())
+        store = SnapshotStore(os.path.join(root_dir, snapshot_dir))
+        snapshot_id, copied = store.create(root_dir, rel_paths if rel_paths is not None else files_to_clean)
+        print(f"{Fore.GREEN}Sicherung {snapshot_id} erstellt ({copied} Dateien neu kopiert){Style.RESET_ALL}")
+        return snapshot_id
+    except Exception as e:
+        print(f"{Fore.RED}Fehler beim Erstellen der Sicherung: {e}{Style.RESET_ALL}")
+        return None
+
+def restore_backup(snapshot_id='latest'):
+    """Stellt alle Dateien eines Snapshots wieder her ('latest' = die neueste Sicherung)"""
+    try:
+        store = SnapshotStore(os.path.join(root_dir, snapshot_dir))
+        snapshot_id, count = store.restore(root_dir, snapshot_id)
+        print(f"{Fore.GREEN}Sicherung {snapshot_id} wiederhergestellt ({count} Dateien){Style.RESET_ALL}")
         return True
     except Exception as e:
-        print(f"{Fore.RED}Fehler beim Erstellen der Sicherung für {file_path}: {e}{Style.RESET_ALL}")
+        print(f"{Fore.RED}Fehler beim Wiederherstellen der Sicherung: {e}{Style.RESET_ALL}")
         return False
 
-def display_file_content(file_path):
-    """Zeigt den vollständigen Inhalt einer Datei an und hebt problematische Zeilen hervor"""
+def line_marks(analysis):
+    """Gibt {Zeilennummer: farbiges Präfix} nur für die markierten Zeilen zurück"""
+    labels = {
+        SUPABASE | BLOG: f"{Fore.RED}[SUPABASE+BLOG] ",
+        SUPABASE: f"{Fore.RED}[SUPABASE] ",
+        BLOG: f"{Fore.MAGENTA}[BLOG] "
+    }
+    return {
+        i: f"{Fore.YELLOW}{i:4} {labels[flags]}{Style.RESET_ALL}"
+        for i, flags in enumerate(analysis.flags, 1) if flags
+    }
+
+def display_file_content(file_path, analysis=None, context=None):
+    """Zeigt den Inhalt einer Datei an und hebt problematische Zeilen hervor -
+    mit context nur die markierten Zeilen ±context statt der ganzen Datei"""
     if not os.path.exists(file_path):
         print(f"{Fore.RED}Datei nicht gefunden: {file_path}{Style.RESET_ALL}")
         return
 
     rel_path = os.path.relpath(file_path, root_dir)
 
-    print(f"\n{Fore.CYAN}{'='*80}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}DATEI: {rel_path}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}{'='*80}{Style.RESET_ALL}\n")
-
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-            lines = content.splitlines()
-
-            for i, line in enumerate(lines, 1):
-                # Prüfe auf Supabase- und Blog-Muster
-                has_supabase = any(re.search(pattern, line, re.IGNORECASE) for pattern in supabase_patterns)
-                has_blog = any(re.search(pattern, line, re.IGNORECASE) for pattern in blog_patterns)
+    with BufferedOutput() as out:
+        out.line(f"\n{Fore.CYAN}{'='*80}{Style.RESET_ALL}")
+        out.line(f"{Fore.CYAN}DATEI: {rel_path}{Style.RESET_ALL}")
+        out.line(f"{Fore.CYAN}{'='*80}{Style.RESET_ALL}\n")
 
-                line_num = f"{i:4}"
+        if analysis is None:
+            analysis = FileAnalysis(file_path)
+        if analysis.error:
+            out.line(f"{Fore.RED}Fehler beim Lesen der Datei: {analysis.error}{Style.RESET_ALL}")
+            return
 
-                if has_supabase and has_blog:
-                    print(f"{Fore.YELLOW}{line_num} {Fore.RED}[SUPABASE+BLOG] {Style.RESET_ALL}{line}")
-                elif has_supabase:
-                    print(f"{Fore.YELLOW}{line_num} {Fore.RED}[SUPABASE] {Style.RESET_ALL}{line}")
-                elif has_blog:
-                    print(f"{Fore.YELLOW}{line_num} {Fore.MAGENTA}[BLOG] {Style.RESET_ALL}{line}")
-                else:
-                    print(f"{Fore.YELLOW}{line_num}{Style.RESET_ALL} {line}")
+        render_lines(out, analysis.lines, line_marks(analysis), context)
 
-            # Zeige Anzahl der gefundenen Probleme
-            supabase_count = sum(1 for line in lines if any(re.search(pattern, line, re.IGNORECASE) for pattern in supabase_patterns))
-            blog_count = sum(1 for line in lines if any(re.search(pattern, line, re.IGNORECASE) for pattern in blog_patterns))
-
-            print(f"\n{Fore.YELLOW}Gefundene Referenzen: {Fore.RED}{supabase_count} Supabase, {Fore.MAGENTA}{blog_count} Blog{Style.RESET_ALL}")
-
-    except Exception as e:
-        print(f"{Fore.RED}Fehler beim Lesen der Datei: {e}{Style.RESET_ALL}")
+        supabase_count = len(analysis.supabase_lines)
+        blog_count = len(analysis.blog_lines)
+        out.line(f"\n{Fore.YELLOW}Gefundene Referenzen: {Fore.RED}{supabase_count} Supabase, {Fore.MAGENTA}{blog_count} Blog{Style.RESET_ALL}")
 
-def generate_clean_instructions(file_path):
-    """Generiert spezifische Bereinigungsanweisungen für die Datei"""
+def generate_clean_instructions(file_path, analysis=None):
+    """Generiert spezifische Bereinigungsanweisungen für die Datei (aus der Analyse, ohne sie erneut zu lesen)"""
     rel_path = os.path.relpath(file_path, root_dir)
     file_info = files_to_clean.get(rel_path, {})
     action = file_info.get('action', 'unknown')
@@ -164,64 +346,187 @@ def generate_clean_instructions(file_path):
         print(f"{Fore.GREEN}Diese Datei sollte komplett durch die bereinigte Version ersetzt werden.{Style.RESET_ALL}")
     elif action == 'modify':
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-                lines = content.splitlines()
+            if analysis is None:
+                analysis = FileAnalysis(file_path)
+            if analysis.error:
+                raise analysis.error
 
-                # Finde die zu entfernenden Zeilen
-                supabase_lines = [i for i, line in enumerate(lines, 1)
-                                  if any(re.search(pattern, line, re.IGNORECASE) for pattern in supabase_patterns)]
-                blog_lines = [i for i, line in enumerate(lines, 1)
-                              if any(re.search(pattern, line, re.IGNORECASE) for pattern in blog_patterns)]
+            # Die zu entfernenden Zeilen stammen aus derselben Klassifizierung wie die Anzeige
+            supabase_lines = analysis.supabase_lines
+            blog_lines = analysis.blog_lines
 
-                if supabase_lines:
-                    print(f"{Fore.GREEN}Zu entfernende Supabase-Zeilen: {', '.join(map(str, supabase_lines))}{Style.RESET_ALL}")
+            if supabase_lines:
+                print(f"{Fore.GREEN}Zu entfernende Supabase-Zeilen: {', '.join(map(str, supabase_lines))}{Style.RESET_ALL}")
 
-                if blog_lines:
-                    print(f"{Fore.GREEN}Zu entfernende Blog-Zeilen: {', '.join(map(str, blog_lines))}{Style.RESET_ALL}")
+            if blog_lines:
+                print(f"{Fore.GREEN}Zu entfernende Blog-Zeilen: {', '.join(map(str, blog_lines))}{Style.RESET_ALL}")
 
-                # Spezifische Anweisungen je nach Datei
-                if 'next.config.js' in file_path:
-                    print(f"{Fore.GREEN}Entferne die Zeile mit 'hostname: 'krqoaacidcyghxhdxtce.supabase.co','{Style.RESET_ALL}")
-                    print(f"{Fore.GREEN}Entferne Blog-Kategorien-Weiterleitungen{Style.RESET_ALL}")
+            # Spezifische Anweisungen je nach Datei
+            if 'next.config.js' in file_path:
+                print(f"{Fore.GREEN}Entferne die Zeile mit 'hostname: 'krqoaacidcyghxhdxtce.supabase.co','{Style.RESET_ALL}")
+                print(f"{Fore.GREEN}Entferne Blog-Kategorien-Weiterleitungen{Style.RESET_ALL}")
 
-                elif '_app.tsx' in file_path:
-                    print(f"{Fore.GREEN}Entferne den Kommentar zum Supabase DNS Prefetch{Style.RESET_ALL}")
+            elif '_app.tsx' in file_path:
+                print(f"{Fore.GREEN}Entferne den Kommentar zum Supabase DNS Prefetch{Style.RESET_ALL}")
 
-                elif 'softwareentwicklung/index.tsx' in file_path:
-                    print(f"{Fore.GREEN}Entferne Supabase aus der Technologie-Liste{Style.RESET_ALL}")
+            elif 'softwareentwicklung/index.tsx' in file_path:
+                print(f"{Fore.GREEN}Entferne Supabase aus der Technologie-Liste{Style.RESET_ALL}")
 
-                elif 'menu.ts' in file_path or 'header.tsx' in file_path or 'footer.tsx' in file_path:
-                    print(f"{Fore.GREEN}Entferne Blog-Einträge aus den Navigationsarrays{Style.RESET_ALL}")
+            elif 'menu.ts' in file_path or 'header.tsx' in file_path or 'footer.tsx' in file_path:
+                print(f"{Fore.GREEN}Entferne Blog-Einträge aus den Navigationsarrays{Style.RESET_ALL}")
 
-                elif 'api.ts' in file_path:
-                    print(f"{Fore.GREEN}Entferne Blog-API-Endpunkte und -Funktionen{Style.RESET_ALL}")
+            elif 'api.ts' in file_path:
+                print(f"{Fore.GREEN}Entferne Blog-API-Endpunkte und -Funktionen{Style.RESET_ALL}")
 
-                elif 'constants.ts' in file_path:
-                    print(f"{Fore.GREEN}Entferne BLOG_CATEGORIES-Array und -Export{Style.RESET_ALL}")
+            elif 'constants.ts' in file_path:
+                print(f"{Fore.GREEN}Entferne BLOG_CATEGORIES-Array und -Export{Style.RESET_ALL}")
 
-                elif 'index.ts' in file_path and 'types' in file_path:
-                    print(f"{Fore.GREEN}Entferne 'export * from './blog';'{Style.RESET_ALL}")
-                    print(f"{Fore.GREEN}Entferne 'blog' aus dem LayoutType{Style.RESET_ALL}")
+            elif 'index.ts' in file_path and 'types' in file_path:
+                print(f"{Fore.GREEN}Entferne 'export * from './blog';'{Style.RESET_ALL}")
+                print(f"{Fore.GREEN}Entferne 'blog' aus dem LayoutType{Style.RESET_ALL}")
 
         except Exception as e:
             print(f"{Fore.RED}Fehler bei der Generierung von Anweisungen: {e}{Style.RESET_ALL}")
 
     print("\nSiehe bereitgestellte bereinigte Dateiversionen in den vorherigen Artefakten.")
 
+def apply_cleanup(dry_run=False, jobs=1, window=PREFETCH_WINDOW):
+    """Entfernt in allen Dateien mit Aktion 'modify' die markierten Zeilen und gibt einen Unified Diff aus.
+
+    Die Zeilen kommen aus derselben FileAnalysis wie die Anzeige (vorab im Thread-Pool klassifiziert),
+    umgeschrieben wird seriell oder mit jobs Prozessen wie bei check_cleanup.
+    """
+    if not dry_run and create_backup() is None:
+        print(f"{Fore.RED}Ohne Sicherung werden keine Dateien verändert.{Style.RESET_ALL}")
+        return
+
+    rel_paths = {}
+    for rel_path, file_info in files_to_clean.items():
+        file_path = os.path.join(root_dir, rel_path)
+        if not os.path.exists(file_path):
+            print(f"{Fore.RED}DATEI NICHT GEFUNDEN: {rel_path}{Style.RESET_ALL}")
+        elif file_info.get('action') == 'modify':
+            rel_paths[file_path] = rel_path
+        else:
+            print(f"{Fore.YELLOW}{rel_path}: Aktion {file_info.get('action', 'unknown').upper()} muss manuell erfolgen{Style.RESET_ALL}")
+
+    # Nur die Nummern der markierten Zeilen behalten, nicht die ganzen Analysen
+    files = []
+    for file_path, analysis in prefetch_analyses(list(rel_paths), window):
+        if analysis is None:
+            continue
+        if analysis.error:
+            print(f"{Fore.RED}Fehler beim Lesen von {rel_paths[file_path]}: {analysis.error}{Style.RESET_ALL}")
+            continue
+        files.append((file_path, rel_paths[file_path], analysis.drop_lines))
+
+    # Alle Dateien umschreiben, Ausgabe in Original-Reihenfolge
+    with create_executor(jobs) as executor:
+        results = rewrite_files(files, dry_run, executor)
+
+    print(f"\n{Fore.CYAN}============ ÄNDERUNGEN ============{Style.RESET_ALL}")
+    for result in results:
+        if result.error:
+            print(f"{Fore.RED}Fehler beim Bereinigen von {result.rel_path}: {result.error}{Style.RESET_ALL}")
+            continue
+        for line in removal_diff(result.rel_path, result.removed).splitlines():
+            color = Fore.RED if line.startswith('-') and not line.startswith('---') else Fore.CYAN if line.startswith('@@') else ''
+            print(f"{color}{line}{Style.RESET_ALL}" if color else line)
+
+    print(f"\n{Fore.CYAN}============ ZUSAMMENFASSUNG ============{Style.RESET_ALL}")
+    for result in results:
+        if not result.error:
+            print(f"{result.rel_path}: {len(result.removed)} Zeilen entfernt")
+
+    changed = sum(1 for result in results if result.removed)
+    removed = sum(len(result.removed) for result in results)
+    verb = 'würden' if dry_run else 'wurden'
+    print(f"{Fore.GREEN}In {changed} Dateien {verb} {removed} Zeilen entfernt.{Style.RESET_ALL}")
+
+def write_patch(patch_path, window=PREFETCH_WINDOW):
+    """Schreibt die Unified Diffs aller MODIFY-Dateien in eine Patch-Datei, ohne Dateien zu verändern.
+
+    Die Patches entstehen parallel im Thread-Pool und werden in Original-Reihenfolge direkt in die
+    Datei geschrieben, sobald sie fertig sind.
+    """
+    rel_paths = [rel_path for rel_path, file_info in files_to_clean.items() if file_info.get('action') == 'modify']
+    changed = removed = 0
+
+    with open(patch_path, 'w', encoding='utf-8', newline='') as patch_file:
+        for rel_path, (patch, count, error) in prefetch(build_patch, rel_paths, window):
+            if error:
+                print(f"{Fore.RED}Fehler beim Erstellen des Patches für {rel_path}: {error}{Style.RESET_ALL}")
+                continue
+            if patch:
+                patch_file.write(patch)
+                changed += 1
+                removed += count
+                print(f"{rel_path}: {count} Zeilen")
+
+    print(f"{Fore.GREEN}Patch für {changed} Dateien ({removed} entfernte Zeilen) geschrieben: {patch_path}{Style.RESET_ALL}")
+
+def parse_args():
+    """Liest die Kommandozeilen-Argumente"""
+    parser = argparse.ArgumentParser(description='Zeigt die zu bereinigenden Dateien mit markierten Supabase- und Blog-Zeilen an.')
+    parser.add_argument('--prefetch', type=int, default=PREFETCH_WINDOW, metavar='N',
+                        help=f'Anzahl der Dateien, die im Voraus gelesen werden (0 = nacheinander, Standard: {PREFETCH_WINDOW})')
+    parser.add_argument('--backup', action='store_true',
+                        help='Vor der Anzeige alle zu bereinigenden Dateien in einem Snapshot sichern')
+    parser.add_argument('--restore', nargs='?', const='latest', metavar='SNAPSHOT',
+                        help='Dateien aus einem Snapshot wiederherstellen (ohne Angabe: der neueste) und beenden')
+    parser.add_argument('--apply', action='store_true',
+                        help='Markierte Zeilen aus allen MODIFY-Dateien entfernen (vorher wird automatisch gesichert)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Mit --apply: nur den Diff anzeigen, keine Dateien verändern')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='Mit --apply: Anzahl paralleler Prozesse (0 = alle CPU-Kerne, Standard: 1)')
+    parser.add_argument('--diff', nargs='?', const='files_to_clean.patch', metavar='PATCHDATEI',
+                        help='Unified Diffs aller MODIFY-Dateien in eine Patch-Datei schreiben (Standard: files_to_clean.patch)')
+    parser.add_argument('--context', type=int, metavar='N',
+                        help='Nur markierte Zeilen mit N Zeilen Kontext statt der ganzen Datei anzeigen')
+    parser.add_argument('--index', action='store_true',
+                        help='Blog-Muster mit Wortgrenzen über den inkrementellen Token-Index statt per Scan finden')
+    return parser.parse_args()
+
 def main():
     """Hauptfunktion zum Ausführen des Scripts"""
+    args = parse_args()
+    install_stdout()
+
     print(f"{Fore.CYAN}============ VOLLSTÄNDIGE ANZEIGE DER ZU BEREINIGENDEN DATEIEN ============{Style.RESET_ALL}")
     print(f"Python Version: {sys.version}")
     print(f"Arbeitsverzeichnis: {os.getcwd()}")
     print(f"Stammverzeichnis: {root_dir}")
     print()
 
-    for rel_path, file_info in files_to_clean.items():
-        file_path = os.path.join(root_dir, rel_path)
-        if os.path.exists(file_path):
-            display_file_content(file_path)
-            generate_clean_instructions(file_path)
+    if args.restore:
+        restore_backup(args.restore)
+        return
+
+    if args.apply:
+        apply_cleanup(args.dry_run, args.jobs, args.prefetch)
+        return
+
+    if args.diff:
+        write_patch(args.diff, args.prefetch)
+        return
+
+    if args.backup:
+        create_backup()
+        print()
+
+    blog_hits = None
+    if args.index:
+        blog_hits = index_blog_hits()
+        print()
+
+    # Threads lesen und klassifizieren die nächsten Dateien, während hier in Original-Reihenfolge ausgegeben wird
+    file_paths = [os.path.join(root_dir, rel_path) for rel_path in files_to_clean]
+    analyses = prefetch_analyses(file_paths, args.prefetch, blog_hits)
+    for rel_path, (file_path, analysis) in zip(files_to_clean, analyses):
+        if analysis is not None:
+            display_file_content(file_path, analysis, args.context)
+            generate_clean_instructions(file_path, analysis)
         else:
             print(f"{Fore.RED}DATEI NICHT GEFUNDEN: {rel_path}{Style.RESET_ALL}\n")
 
@@ -1,17 +1,122 @@
 import os
 
-def print_file_content(file_path):
-    """Print the content of a file with a nice header."""
+from scan_engine import Traversal
+
+# Bilder, auf die noch verwiesen wird, die es aber nicht mehr gibt
+missing_images = ("modern-office-building.png", "abstract-tech-logo.png")
+
+image_extensions = ('.png', '.jpg', '.jpeg', '.svg', '.gif')
+
+def print_file_content(file_path, content=None, error=None):
+    """Print the content of a file with a nice header (reads the file only if no content is given)."""
     print("\n" + "=" * 80)
     print(f"FILE: {file_path}")
     print("=" * 80)
 
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            print(content)
-    except Exception as e:
-        print(f"Error reading file: {str(e)}")
+    if error:
+        print(f"Error reading file: {error}")
+        return
+
+    if content is None:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception as e:
+            print(f"Error reading file: {str(e)}")
+            return
+
+    print(content)
+
+def keep_content(text):
+    """Analysis function that keeps the whole content for printing."""
+    return text
+
+def find_missing_image_reference(text):
+    """Analysis function: returns the content if it references one of the missing images."""
+    if any(image in text for image in missing_images):
+        return text
+    return None
+
+class PrimaryFilesCheck:
+    """Collects the content of the primary files to fix while walking the tree."""
+
+    name = 'primary'
+    analyze = staticmethod(keep_content)
+
+    def __init__(self, files_to_fix):
+        self.files_to_fix = set(files_to_fix)
+        self.contents = {}
+
+    def accepts(self, record):
+        return record.path in self.files_to_fix
+
+    def collect(self, record, content, error):
+        self.contents[record.path] = (content, error)
+
+    def finish(self):
+        pass
+
+class ImageReferenceCheck:
+    """Finds additional source files in src/ that reference missing images."""
+
+    name = 'image_references'
+    analyze = staticmethod(find_missing_image_reference)
+
+    def __init__(self, files_to_fix):
+        self.files_to_fix = set(files_to_fix)
+        self.image_references = []
+
+    def accepts(self, record):
+        return record.rel_path.startswith("src" + os.sep) and record.name.endswith((".tsx", ".ts", ".jsx", ".js"))
+
+    def collect(self, record, content, error):
+        if content is not None and record.path not in self.files_to_fix:
+            self.image_references.append((record.path, content))
+
+    def finish(self):
+        pass
+
+class ImageListCheck:
+    """Lists the images in public/ and public/images/ without reading them."""
+
+    name = 'images'
+    analyze = None
+
+    def __init__(self):
+        self.all_images = []
+
+    def accepts(self, record):
+        images_dir = os.path.join("public", "images")
+        in_public = record.rel_dir in ("public", images_dir) or record.rel_dir.startswith(images_dir + os.sep)
+        return in_public and record.name.lower().endswith(image_extensions)
+
+    def collect(self, record, result, error):
+        self.all_images.append(record.rel_path)
+
+    def finish(self):
+        pass
+
+def make_skip_dir(project_root):
+    """Only walk src/ and public/images/ - everything else is pruned."""
+    def skip_dir(dir_path):
+        rel_dir = os.path.relpath(dir_path, project_root)
+        parts = rel_dir.split(os.sep)
+        if parts[0] == "src":
+            return False
+        return not (parts[0] == "public" and (len(parts) == 1 or parts[1] == "images"))
+    return skip_dir
+
+def scan_project(project_root, files_to_fix):
+    """Walk the project once and return the primary file, image reference and image list checks."""
+    primary_check = PrimaryFilesCheck(files_to_fix)
+    reference_check = ImageReferenceCheck(files_to_fix)
+    image_check = ImageListCheck()
+
+    traversal = Traversal(project_root, make_skip_dir(project_root))
+    for check in (primary_check, reference_check, image_check):
+        traversal.register(check)
+    traversal.run()
+    return primary_check, reference_check, image_check
 
 def main():
     # Projektroot-Verzeichnis
@@ -26,56 +131,32 @@ def main():
         os.path.join(project_root, "src", "components", "common", "image-with-fallback.tsx")
     ]
 
-    # Suche nach Dateien, die auf fehlende Bilder verweisen
-    image_references = []
-    for root, dirs, files in os.walk(os.path.join(project_root, "src")):
-        for file in files:
-            if file.endswith((".tsx", ".ts", ".jsx", ".js")):
-                file_path = os.path.join(root, file)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        if "modern-office-building.png" in content or "abstract-tech-logo.png" in content:
-                            if file_path not in files_to_fix and file_path not in image_references:
-                                image_references.append(file_path)
-                except:
-                    pass
+    # Ein gemeinsamer Durchlauf für Bildreferenzen, Primärdateien und verfügbare Bilder
+    primary_check, reference_check, image_check = scan_project(project_root, files_to_fix)
 
     # Ausgabe aller Dateien
     print(f"Found {len(files_to_fix)} primary files to fix:")
     for file in files_to_fix:
-        if os.path.exists(file):
+        if file in primary_check.contents:
+            content, error = primary_check.contents[file]
+            print_file_content(file, content, error)
+        elif os.path.exists(file):
             print_file_content(file)
         else:
             print(f"\nWARNING: File not found: {file}")
 
     # Ausgabe aller Dateien mit Bildreferenzen
+    image_references = reference_check.image_references
     if image_references:
         print(f"\n\nFound {len(image_references)} additional files with image references:")
-        for file in image_references:
-            print_file_content(file)
+        for file, content in image_references:
+            print_file_content(file, content)
 
     # Alternative Bilder auflisten
     print("\n\nAvailable alternative images:")
-    images_dir = os.path.join(project_root, "public", "images")
-    public_dir = os.path.join(project_root, "public")
-
-    all_images = []
-
-    # Bilder im public-Verzeichnis
-    for file in os.listdir(public_dir):
-        if file.lower().endswith(('.png', '.jpg', '.jpeg', '.svg', '.gif')):
-            all_images.append(os.path.join("public", file))
-
-    # Bilder in Unterverzeichnissen
-    for root, dirs, files in os.walk(images_dir):
-        rel_path = os.path.relpath(root, project_root)
-        for file in files:
-            if file.lower().endswith(('.png', '.jpg', '.jpeg', '.svg', '.gif')):
-                all_images.append(os.path.join(rel_path, file))
 
-    for image in sorted(all_images):
+    for image in sorted(image_check.all_images):
         print(f"  - {image}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,178 @@
+import os
+import shutil
+import tempfile
+from bisect import bisect_right
+
+from scan_engine import map_files
+
+# Größe der Blöcke, in denen Dateien gelesen werden - Blöcke enden immer an einem Zeilenende
+CHUNK_SIZE = 256 * 1024
+
+def iter_line_blocks(file, chunk_size=CHUNK_SIZE):
+    """Liest eine Textdatei blockweise und gibt Blöcke aus ganzen Zeilen zurück (Blöcke enden an einem \\n, nur der letzte nicht unbedingt)"""
+    rest = ''
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        chunk = rest + chunk
+        cut = chunk.rfind('\n') + 1
+        if cut == 0:
+            rest = chunk
+            continue
+        rest = chunk[cut:]
+        yield chunk[:cut]
+    if rest:
+        yield rest
+
+class RewriteResult:
+    """Ergebnis für eine Datei: entfernte Zeilen als (Zeilennummer, Zeile inkl. Zeilenende) oder ein Fehler"""
+
+    __slots__ = ('rel_path', 'removed', 'error')
+
+    def __init__(self, rel_path, removed=None, error=None):
+        self.rel_path = rel_path
+        self.removed = removed or []
+        self.error = error
+
+def filter_lines(src, drop, removed, chunk_size=CHUNK_SIZE):
+    """Gibt den Text ohne die Zeilen drop (1-basiert, aufsteigend) blockweise zurück und sammelt diese in removed.
+
+    Zeilen werden wie bei str.splitlines() getrennt (auch an \\r allein) - dieselben Grenzen, mit denen
+    die Zeilen klassifiziert werden. Blöcke enden an einem \\n, ein \\r\\n wird also nie geteilt.
+    """
+    drop_set = set(drop)
+    line_offset = 0
+    for block in iter_line_blocks(src, chunk_size):
+        lines = block.splitlines(keepends=True)
+        end = line_offset + len(lines)
+        if bisect_right(drop, line_offset) == bisect_right(drop, end):
+            yield block
+        else:
+            kept = []
+            for line_num, line in enumerate(lines, line_offset + 1):
+                if line_num in drop_set:
+                    removed.append((line_num, line))
+                else:
+                    kept.append(line)
+            yield ''.join(kept)
+        line_offset = end
+
+def rewrite_file(file_path, rel_path, drop, dry_run=False, chunk_size=CHUNK_SIZE):
+    """Entfernt Zeilen als Streaming-Transformation und ersetzt die Datei atomar (Temp-Datei + os.replace).
+
+    drop sind die 1-basierten Nummern der zu entfernenden Zeilen (z.B. aus einer bereits vorhandenen
+    Analyse). Zeilenenden bleiben erhalten; ohne Änderungen bleibt die Datei unangetastet. Mit dry_run
+    werden die Zeilen nur ermittelt, es wird nichts geschrieben (auch keine Temp-Datei).
+    """
+    drop = sorted(drop)
+    removed = []
+    if not drop:
+        return RewriteResult(rel_path, removed)
+
+    if dry_run:
+        try:
+            with open(file_path, 'r', encoding='utf-8', newline='') as src:
+                for _ in filter_lines(src, drop, removed, chunk_size):
+                    pass
+        except Exception as e:
+            return RewriteResult(rel_path, error=e)
+        return RewriteResult(rel_path, removed)
+
+    dst_dir = os.path.dirname(file_path) or '.'
+    fd, temp_path = tempfile.mkstemp(dir=dst_dir, prefix='.tmp-')
+    try:
+        with open(file_path, 'r', encoding='utf-8', newline='') as src, \
+                open(fd, 'w', encoding='utf-8', newline='') as dst:
+            dst.writelines(filter_lines(src, drop, removed, chunk_size))
+
+        if removed:
+            shutil.copymode(file_path, temp_path)
+            os.replace(temp_path, file_path)
+        else:
+            os.remove(temp_path)
+    except Exception as e:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return RewriteResult(rel_path, error=e)
+
+    return RewriteResult(rel_path, removed)
+
+def rewrite_files(files, dry_run=False, executor=None):
+    """Schreibt mehrere Dateien um - files sind (Pfad, relativer Pfad, zu entfernende Zeilen).
+
+    Läuft seriell oder im Pool aus scan_engine.create_executor, Ergebnisse in Eingabe-Reihenfolge.
+    """
+    tasks = ((rel_path, (file_path, rel_path, drop, dry_run)) for file_path, rel_path, drop in files)
+    return [result for _, result in map_files(rewrite_file, executor, tasks)]
+
+def removal_diff(rel_path, removed):
+    """Gibt einen Unified Diff (ohne Kontextzeilen) für entfernte Zeilen zurück"""
+    if not removed:
+        return ''
+
+    rel_path = rel_path.replace(os.sep, '/')
+    output = [f'--- a/{rel_path}\n', f'+++ b/{rel_path}\n']
+
+    # Aufeinanderfolgende Zeilen bilden einen Hunk
+    removed_before = 0
+    index = 0
+    while index < len(removed):
+        end = index + 1
+        while end < len(removed) and removed[end][0] == removed[end - 1][0] + 1:
+            end += 1
+
+        start = removed[index][0]
+        count = end - index
+        output.append(f'@@ -{start},{count} +{start - removed_before - 1},0 @@\n')
+        for _, line in removed[index:end]:
+            if line.endswith(('\n', '\r')):
+                output.append(f'-{line}')
+            else:
+                output.append(f'-{line}\n\\ No newline at end of file\n')
+
+        removed_before += count
+        index = end
+
+    return ''.join(output)
+
+def removal_patch(rel_path, lines, drop, context=3, final_newline=True):
+    """Gibt einen Unified Diff mit Kontextzeilen zurück, der die Zeilen drop (1-basiert, sortiert) entfernt.
+
+    lines sind die Zeilen ohne Zeilenende (z.B. aus einer bereits vorhandenen Analyse); es werden nur
+    die Hunks selbst zusammengesetzt, nie eine bereinigte Kopie der ganzen Datei.
+    """
+    if not drop:
+        return ''
+
+    rel_path = rel_path.replace(os.sep, '/')
+    output = [f'--- a/{rel_path}\n', f'+++ b/{rel_path}\n']
+    line_count = len(lines)
+    drop_set = set(drop)
+
+    # Entfernte Zeilen, deren Kontextbereiche sich berühren, landen im selben Hunk
+    groups = [[drop[0]]]
+    for line_num in drop[1:]:
+        if line_num - groups[-1][-1] <= 2 * context + 1:
+            groups[-1].append(line_num)
+        else:
+            groups.append([line_num])
+
+    removed_before = 0
+    for group in groups:
+        start = max(1, group[0] - context)
+        end = min(line_count, group[-1] + context)
+        old_count = end - start + 1
+        new_count = old_count - len(group)
+        new_start = start - removed_before - (0 if new_count else 1)
+        output.append(f'@@ -{start},{old_count} +{new_start},{new_count} @@\n')
+
+        for line_num in range(start, end + 1):
+            prefix = '-' if line_num in drop_set else ' '
+            output.append(f'{prefix}{lines[line_num - 1]}\n')
+            if line_num == line_count and not final_newline:
+                output.append('\\ No newline at end of file\n')
+
+        removed_before += len(group)
+
+    return ''.join(output)
@@ -0,0 +1,129 @@
+import os
+import json
+import sqlite3
+import hashlib
+
+from match_store import encode_result, decode_result
+
+# Version des Cache-Formats - bei Änderungen am Schema oder an den Ergebnissen erhöhen
+CACHE_VERSION = 8
+
+# Anzahl neuer Einträge, nach der sie gesammelt in die Datenbank geschrieben werden
+WRITE_BATCH_SIZE = 1000
+
+def content_hash(data):
+    """Berechnet den Inhalts-Hash einer Datei (bytes)"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def config_hash(config):
+    """Berechnet einen Hash über die Check-Konfiguration (z.B. Keyword-Listen) - ändert sie sich, ändert sich der Hash"""
+    payload = json.dumps({'version': CACHE_VERSION, 'config': config}, sort_keys=True)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+class ScanCache:
+    """Persistenter Scan-Cache (SQLite) mit Einträgen pro Datei: mtime_ns, Größe, Inhalts-Hash, Check-Namen, Ergebnisse.
+
+    config enthält alles, was die Ergebnisse beeinflusst (z.B. die Keyword-Listen); ändert es sich,
+    werden alle Einträge verworfen.
+    """
+
+    def __init__(self, cache_path, config):
+        self.cache_path = cache_path
+        self.keyword_hash = config_hash(config)
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        self.connection = sqlite3.connect(cache_path)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+
+        # Geänderte Keyword-Listen (oder eine neue CACHE_VERSION) machen alle Einträge ungültig - die Tabelle
+        # wird neu angelegt, damit auch ein geändertes Schema übernommen wird
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'keyword_hash'").fetchone()
+        if row is None or row[0] != self.keyword_hash:
+            self.connection.execute('DROP TABLE IF EXISTS files')
+            self.connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('keyword_hash', ?)", (self.keyword_hash,)
+            )
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS files ('
+            ' path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER,'
+            ' content_hash TEXT, keyword_hash TEXT, checks TEXT, results TEXT)'
+        )
+
+        # Die Metadaten aller Einträge einmal laden - ein Lookup pro Datei wäre bei großen Bäumen langsamer.
+        # Die Ergebnisse selbst holt erst load(), damit nie alle gespeicherten Treffer gleichzeitig im Speicher liegen
+        self.entries = {
+            path: (mtime_ns, size, digest, frozenset(checks.split()))
+            for path, mtime_ns, size, digest, checks in self.connection.execute(
+                'SELECT path, mtime_ns, size, content_hash, checks FROM files WHERE keyword_hash = ?',
+                (self.keyword_hash,)
+            )
+        }
+        self.seen = set()
+        self.pending = []
+
+    def lookup(self, rel_path, stat_result, names):
+        """Gibt (Treffer, bekannter Hash) zurück - ein Treffer nur, wenn mtime und Größe unverändert sind
+        und der Eintrag Ergebnisse für alle angefragten Checks (names) enthält; die Ergebnisse liefert load()"""
+        self.seen.add(rel_path)
+        entry = self.entries.get(rel_path)
+        if entry is None:
+            return False, None
+
+        mtime_ns, size, digest, checks = entry
+        if size != stat_result.st_size or not checks.issuperset(names):
+            return False, None
+        if mtime_ns == stat_result.st_mtime_ns:
+            self.hits += 1
+            return True, digest
+
+        # Nur die mtime hat sich geändert - der Inhalts-Hash entscheidet später
+        return False, digest
+
+    def _results(self, rel_path):
+        row = self.connection.execute('SELECT results FROM files WHERE path = ?', (rel_path,)).fetchone()
+        return row[0]
+
+    def load(self, rel_path):
+        """Liest und dekodiert die gespeicherten Ergebnisse einer Datei erst, wenn sie gebraucht werden"""
+        return json.loads(self._results(rel_path), object_hook=decode_result)
+
+    def reuse(self, rel_path, stat_result):
+        """Übernimmt die gespeicherten Ergebnisse für eine Datei mit neuer mtime, aber gleichem Inhalt"""
+        self.hits += 1
+        mtime_ns, size, digest, checks = self.entries[rel_path]
+        results = self._results(rel_path)
+        self._add_pending(rel_path, stat_result, digest, ' '.join(sorted(checks)), results)
+        return json.loads(results, object_hook=decode_result)
+
+    def store(self, rel_path, stat_result, digest, results):
+        """Merkt sich die neu berechneten Ergebnisse einer Datei zum Schreiben in save()"""
+        self.misses += 1
+        self._add_pending(
+            rel_path, stat_result, digest, ' '.join(sorted(results)), json.dumps(results, default=encode_result)
+        )
+
+    def _add_pending(self, rel_path, stat_result, digest, checks, encoded):
+        self.pending.append(
+            (rel_path, stat_result.st_mtime_ns, stat_result.st_size, digest, self.keyword_hash, checks, encoded)
+        )
+        # Neue Einträge schubweise schreiben, damit sie sich bei großen Bäumen nicht im Speicher stauen
+        if len(self.pending) >= WRITE_BATCH_SIZE:
+            self._write_pending()
+
+    def _write_pending(self):
+        with self.connection:
+            self.connection.executemany('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)', self.pending)
+        self.pending = []
+
+    def save(self):
+        """Schreibt alle noch offenen Einträge und entfernt gelöschte Dateien"""
+        self._write_pending()
+        with self.connection:
+            removed = [(path,) for path in self.entries if path not in self.seen]
+            self.connection.executemany('DELETE FROM files WHERE path = ?', removed)
+
+    def close(self):
+        """Schließt die Datenbankverbindung"""
+        self.connection.close()
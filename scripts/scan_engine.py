@@ -0,0 +1,556 @@
+import os
+import re
+import mmap
+import contextlib
+from array import array
+from collections import deque
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+from scan_cache import content_hash
+from match_store import MatchList
+
+# Regex-Metazeichen - Begriffe ohne diese Zeichen werden als reine Literale behandelt
+REGEX_METAZEICHEN = set('.^$*+?{}[]\\|()')
+
+# Nicht-ASCII-Zeichen, die mit re.IGNORECASE auf ASCII-Buchstaben passen, nach lower() aber nicht
+# (İ, ı, ſ). Enthält ein Text eines davon, wird der exakte IGNORECASE-Pfad verwendet.
+SONDERFALL_ZEICHEN = re.compile('[İıſ]')
+
+# Ab dieser Größe wird eine Datei per mmap durchsucht statt komplett eingelesen
+MMAP_THRESHOLD = 1024 * 1024
+
+# Größe der Abschnitte, die beim Puffer-Scan auf einmal kleingeschrieben und durchsucht werden
+CHUNK_SIZE = 1024 * 1024
+
+# Dateien pro Paket, das im Prozess-Pool auf einmal analysiert wird
+MAP_CHUNK_SIZE = 16
+
+# Pakete pro Prozess, die gleichzeitig unterwegs sein dürfen - begrenzt den Speicher für fertige Ergebnisse
+MAP_WINDOW_PER_WORKER = 4
+
+NEWLINE = re.compile(b'\n')
+
+# Endungen, die nie als Text gelesen werden müssen - diese Dateien werden gar nicht geöffnet
+BINARY_EXTENSIONS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.ico', '.webp', '.avif', '.bmp', '.tiff',
+    '.woff', '.woff2', '.ttf', '.otf', '.eot',
+    '.pdf', '.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.rar',
+    '.mp3', '.mp4', '.webm', '.wav', '.ogg', '.mov',
+    '.exe', '.dll', '.so', '.dylib', '.pyc', '.class', '.jar',
+    '.sqlite', '.db'
+})
+
+# Größe des Puffer-Anfangs, anhand dessen Binärdaten erkannt werden
+SNIFF_SIZE = 8192
+
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# Bytes, die in Textdateien vorkommen (inkl. Latin-1), alles andere sind Steuerzeichen
+TEXT_BYTES = bytes(sorted({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f}))
+
+# surrogateescape bildet ungültige UTF-8-Bytes auf diese Zeichen ab
+ESCAPED_BYTES = re.compile('[\udc80-\udcff]')
+
+def is_literal(term):
+    """Überprüft, ob ein Suchbegriff ein reines ASCII-Literal ohne Regex-Syntax ist"""
+    return term.isascii() and not REGEX_METAZEICHEN.intersection(term)
+
+def build_trie_pattern(words):
+    """Baut aus Literalen ein Regex mit gemeinsamen Präfixen (Trie-Alternation)"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = None
+
+    def build(node):
+        alternatives = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not alternatives:
+            return ''
+        pattern = alternatives[0] if len(alternatives) == 1 else f"(?:{'|'.join(alternatives)})"
+        if '' in node:
+            pattern = f'(?:{pattern})?'
+        return pattern
+
+    return build(trie)
+
+def minimal_literals(words):
+    """Entfernt Literale, die ein anderes Literal bereits als Teilstring enthalten"""
+    unique = sorted(set(words), key=len)
+    result = []
+    for word in unique:
+        if not any(shorter in word for shorter in result):
+            result.append(word)
+    return result
+
+class LineIndex:
+    """Zeilenanfänge eines Puffers - wird erst bei Bedarf und nur so weit wie nötig aufgebaut"""
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.starts = array('Q', [0])
+        # Bis zu diesem Offset sind alle Zeilenanfänge bekannt
+        self.indexed_to = 0
+
+    def _extend(self, offset):
+        """Ergänzt die Zeilenanfänge abschnittsweise, bis offset abgedeckt ist"""
+        size = len(self.buffer)
+        while self.indexed_to <= offset and self.indexed_to < size:
+            end = min(size, max(offset + 1, self.indexed_to + CHUNK_SIZE))
+            self.starts.extend(match.end() for match in NEWLINE.finditer(self.buffer, self.indexed_to, end))
+            self.indexed_to = end
+
+    def line_of(self, offset):
+        """Gibt die (1-basierte) Zeilennummer für einen Byte-Offset zurück"""
+        self._extend(offset)
+        return bisect_right(self.starts, offset)
+
+class KeywordMatcher:
+    """Kombiniert mehrere Keyword-Gruppen zu einem einzigen vorkompilierten Suchmuster"""
+
+    def __init__(self, groups, flags=re.IGNORECASE):
+        # groups: {'supabase': [...], 'blog': [...]} - Reihenfolge bleibt erhalten
+        self.groups = {name: list(terms) for name, terms in groups.items()}
+        self.fold_case = bool(flags & re.IGNORECASE)
+
+        # Einzelmuster (Gruppe, Index in der Gruppe, Begriff, kompiliertes Muster, Literal) in Original-Reihenfolge
+        self.terms = []
+        for name, terms in self.groups.items():
+            for term_id, term in enumerate(terms):
+                literal = term.lower() if self.fold_case else term
+                self.terms.append((name, term_id, term, re.compile(term, flags), literal if is_literal(term) else None))
+
+        unique_terms = list(dict.fromkeys(term for _, _, term, _, _ in self.terms))
+        literals = [term.lower() if self.fold_case else term for term in unique_terms if is_literal(term)]
+        others = [term for term in unique_terms if not is_literal(term)]
+
+        # Exakter Fallback: alle Begriffe als eine Alternation auf dem Originaltext
+        self.combined = re.compile('|'.join(f'(?:{term})' for term in unique_terms), flags)
+
+        # Schneller Pfad: Literale als Trie auf dem einmal kleingeschriebenen Text,
+        # reguläre Ausdrücke als eigene Alternation auf dem Originaltext
+        self.literal_pattern = re.compile(build_trie_pattern(minimal_literals(literals))) if literals else None
+        self.regex_pattern = re.compile('|'.join(f'(?:{term})' for term in others), flags) if others else None
+
+        # Dieselben Muster für bytes (Puffer-Scan), None wenn sie dort nicht exakt wären
+        self.bytes_patterns = self._compile_bytes_patterns()
+
+    def empty_results(self):
+        """Gibt ein leeres Ergebnis-Dict mit einer kompakten Trefferliste pro Gruppe zurück"""
+        return {name: MatchList(terms) for name, terms in self.groups.items()}
+
+    def _hit_line_starts(self, pattern, text, starts):
+        """Sammelt die Zeilenanfänge aller Zeilen, in denen das Muster mindestens einmal passt"""
+        newline = '\n' if isinstance(text, str) else b'\n'
+        search = pattern.search
+        match = search(text)
+        while match:
+            line_start = text.rfind(newline, 0, match.start()) + 1
+            starts.add(line_start)
+            line_end = text.find(newline, match.end())
+            if line_end == -1:
+                break
+            match = search(text, line_end + 1)
+
+    def _text_hit_starts(self, text):
+        """Bestimmt die Zeilenanfänge aller Trefferzeilen eines Textes und gibt (Anfänge, kleingeschriebener
+        Text oder None) zurück - None, wenn der schnelle Literal-Pfad nicht exakt wäre"""
+        folded = text.lower() if self.fold_case else text
+        fast_path = len(folded) == len(text) and not (self.fold_case and SONDERFALL_ZEICHEN.search(text))
+
+        starts = set()
+        if fast_path:
+            if self.literal_pattern is not None:
+                self._hit_line_starts(self.literal_pattern, folded, starts)
+            if self.regex_pattern is not None:
+                self._hit_line_starts(self.regex_pattern, text, starts)
+        else:
+            self._hit_line_starts(self.combined, text, starts)
+
+        return starts, folded if fast_path else None
+
+    def _match_line(self, line, folded_line, results, line_num):
+        """Prüft eine Trefferzeile gegen jeden einzelnen Begriff in Original-Reihenfolge"""
+        stripped = line.strip()
+        for group, term_id, term, pattern, literal in self.terms:
+            if literal is not None and folded_line is not None:
+                found = literal in folded_line
+            else:
+                found = pattern.search(line) is not None
+            if found:
+                results[group].append(line_num, term_id, stripped)
+
+    def scan_text(self, text):
+        """Durchsucht einen Text in einem Durchgang und gibt die Treffer je Gruppe zurück"""
+        results = self.empty_results()
+
+        # Zeilen mit mindestens einem Treffer über den gesamten Text bestimmen
+        starts, folded = self._text_hit_starts(text)
+
+        # Nur Trefferzeilen einzeln auswerten, Zeilennummern inkrementell zählen
+        line_num = 1
+        previous = 0
+        for line_start in sorted(starts):
+            line_num += text.count('\n', previous, line_start)
+            previous = line_start
+
+            # Zeile inklusive Zeilenumbruch, wie beim zeilenweisen Lesen der Datei
+            line_end = text.find('\n', line_start)
+            line_end = len(text) if line_end == -1 else line_end + 1
+            folded_line = folded[line_start:line_end] if folded is not None else None
+            self._match_line(text[line_start:line_end], folded_line, results, line_num)
+
+        return results
+
+    def _compile_bytes_patterns(self):
+        """Kompiliert die Suchmuster für bytes - nur auf reinen ASCII-Abschnitten verwendet"""
+        literal = regex = None
+        if self.literal_pattern is not None:
+            literal = re.compile(self.literal_pattern.pattern.encode('ascii'))
+        if self.regex_pattern is not None:
+            source = self.regex_pattern.pattern
+            # \s deckt in str-Mustern auch \x1c-\x1f ab, in bytes-Mustern nicht
+            if not source.isascii() or '\\s' in source or '\\S' in source:
+                return None
+            regex = re.compile(source.encode('ascii'), self.regex_pattern.flags & re.IGNORECASE)
+        return literal, regex
+
+    def scan_buffer(self, buffer, start=0):
+        """Durchsucht einen bytes-ähnlichen Puffer (z.B. mmap) abschnittsweise ohne ihn komplett zu kopieren.
+
+        Zeilennummern werden nur für Trefferzeilen über einen lazy aufgebauten LineIndex bestimmt.
+        Der Puffer muss \\n-Zeilenumbrüche haben; die Ergebnisse entsprechen scan_text().
+        """
+        results = self.empty_results()
+        bytes_patterns = self.bytes_patterns
+        size = len(buffer)
+
+        # Byte-Offsets aller Trefferzeilen sammeln
+        hit_starts = []
+        position = start
+        while position < size:
+            # Abschnitte enden immer an einem Zeilenende
+            chunk_end = buffer.find(b'\n', min(position + CHUNK_SIZE, size) - 1)
+            chunk_end = size if chunk_end == -1 else chunk_end + 1
+            chunk = buffer[position:chunk_end]
+
+            starts = set()
+            if bytes_patterns is not None and chunk.isascii():
+                literal, regex = bytes_patterns
+                if literal is not None:
+                    self._hit_line_starts(literal, chunk.lower() if self.fold_case else chunk, starts)
+                if regex is not None:
+                    self._hit_line_starts(regex, chunk, starts)
+                hit_starts.extend(position + line_start for line_start in sorted(starts))
+            else:
+                # Nicht-ASCII: Abschnitt dekodieren und Zeichen- in Byte-Offsets umrechnen
+                text = chunk.decode('utf-8', 'surrogateescape')
+                char_starts, _ = self._text_hit_starts(text)
+                byte_offset = previous = 0
+                for line_start in sorted(char_starts):
+                    byte_offset += len(text[previous:line_start].encode('utf-8', 'surrogateescape'))
+                    previous = line_start
+                    hit_starts.append(position + byte_offset)
+
+            position = chunk_end
+
+        # Nur Trefferzeilen dekodieren und einzeln auswerten
+        line_index = LineIndex(buffer)
+        for line_start in hit_starts:
+            line_end = buffer.find(b'\n', line_start)
+            line_end = size if line_end == -1 else line_end + 1
+            raw_line = buffer[line_start:line_end]
+
+            line = raw_line.decode('utf-8', 'surrogateescape')
+            if ESCAPED_BYTES.search(line):
+                line = raw_line.decode('latin-1')
+
+            folded_line = line.lower() if self.fold_case else line
+            if len(folded_line) != len(line) or (self.fold_case and SONDERFALL_ZEICHEN.search(line)):
+                folded_line = None
+            self._match_line(line, folded_line, results, line_index.line_of(line_start))
+
+        return results
+
+def is_binary_sample(sample):
+    """Binär, wenn der Anfang NUL-Bytes enthält oder kein UTF-8 ist und überwiegend aus Steuerzeichen besteht"""
+    if b'\x00' in sample:
+        return True
+    if sample.isascii() or not ESCAPED_BYTES.search(sample.decode('utf-8', 'surrogateescape')):
+        return False
+    return len(sample.translate(None, TEXT_BYTES)) * 10 > len(sample)
+
+def sniff_text(data, ext=''):
+    """Entscheidet anhand eines einzigen Puffers zwischen Text und Binärdaten.
+
+    Gibt (Text, Kodierung) zurück, (None, None) für Binärdaten. Erkennt bekannte Binär-Endungen,
+    NUL-Bytes, ein UTF-8-BOM und fällt für ungültiges UTF-8 auf Latin-1 zurück - ohne Exceptions.
+    Zeilenumbrüche werden wie beim Lesen im Textmodus vereinheitlicht.
+    """
+    if ext in BINARY_EXTENSIONS:
+        return None, None
+
+    sample = data[:SNIFF_SIZE]
+    if b'\x00' in sample:
+        return None, None
+
+    if data.startswith(UTF8_BOM):
+        data = data[len(UTF8_BOM):]
+
+    if data.isascii():
+        text, encoding = data.decode('ascii'), 'ascii'
+    else:
+        text, encoding = data.decode('utf-8', 'surrogateescape'), 'utf-8'
+        if ESCAPED_BYTES.search(text):
+            # Kein gültiges UTF-8: viele Steuerzeichen deuten auf Binärdaten hin, sonst Latin-1
+            if len(sample.translate(None, TEXT_BYTES)) * 10 > len(sample):
+                return None, None
+            text, encoding = data.decode('latin-1'), 'latin-1'
+
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text, encoding
+
+class FileRecord:
+    """Eine Datei aus dem Durchlauf - stat() und Inhalt werden erst bei Bedarf und nur einmal geladen"""
+
+    __slots__ = ('path', 'rel_path', 'name', 'ext', '_stat', '_data')
+
+    def __init__(self, path, rel_path):
+        self.path = path
+        self.rel_path = rel_path
+        self.name = os.path.basename(path)
+        self.ext = os.path.splitext(self.name)[1].lower()
+        self._stat = None
+        self._data = None
+
+    @property
+    def rel_dir(self):
+        """Relatives Verzeichnis der Datei ('' für das Stammverzeichnis)"""
+        return os.path.dirname(self.rel_path)
+
+    @property
+    def stat(self):
+        """Ergebnis von os.stat(), beim ersten Zugriff ermittelt"""
+        if self._stat is None:
+            self._stat = os.stat(self.path)
+        return self._stat
+
+    @property
+    def data(self):
+        """Dateiinhalt als bytes, beim ersten Zugriff gelesen"""
+        if self._data is None:
+            with open(self.path, 'rb') as file:
+                self._data = file.read()
+        return self._data
+
+def walk_records(root_dir, skip_dir=None):
+    """Durchläuft root_dir einmal mit os.walk und liefert einen FileRecord pro Datei"""
+    for root, dirs, files in os.walk(root_dir):
+        # Zu überspringende Verzeichnisse filtern
+        if skip_dir is not None:
+            dirs[:] = [d for d in dirs if not skip_dir(os.path.join(root, d))]
+
+        for file in files:
+            file_path = os.path.join(root, file)
+            yield FileRecord(file_path, os.path.relpath(file_path, root_dir))
+
+def create_executor(jobs):
+    """Erstellt einen Prozess-Pool für jobs > 1, sonst einen leeren Kontext (serieller Lauf)"""
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs <= 1:
+        return contextlib.nullcontext(None)
+    return ProcessPoolExecutor(max_workers=jobs)
+
+def apply_chunk(function, tasks):
+    """Wendet eine Funktion auf ein Paket von Argument-Tupeln an (läuft im Pool-Prozess)"""
+    return [function(*args) for args in tasks]
+
+def map_files(function, executor, tasks):
+    """Liefert (Schlüssel, Ergebnis) für alle tasks - seriell oder im Pool, immer in Eingabe-Reihenfolge.
+
+    tasks liefert (Schlüssel, Argument-Tupel oder None) und wird erst beim Abarbeiten gelesen; für None
+    wird nichts berechnet und None geliefert. Im Pool sind höchstens MAP_WINDOW_PER_WORKER Pakete pro
+    Prozess gleichzeitig unterwegs, der Speicherbedarf hängt so nicht von der Größe des Baums ab.
+    """
+    if executor is None:
+        for key, args in tasks:
+            yield key, None if args is None else function(*args)
+        return
+
+    window = (getattr(executor, '_max_workers', None) or os.cpu_count() or 1) * MAP_WINDOW_PER_WORKER
+    submitted = deque()
+
+    def submit(chunk):
+        work = [args for _, args in chunk if args is not None]
+        submitted.append((chunk, executor.submit(apply_chunk, function, work) if work else None))
+
+    def finished():
+        chunk, future = submitted.popleft()
+        results = iter(future.result() if future is not None else ())
+        for key, args in chunk:
+            yield key, None if args is None else next(results)
+
+    chunk = []
+    for task in tasks:
+        chunk.append(task)
+        if len(chunk) == MAP_CHUNK_SIZE:
+            submit(chunk)
+            chunk = []
+            if len(submitted) >= window:
+                yield from finished()
+    if chunk:
+        submit(chunk)
+    while submitted:
+        yield from finished()
+
+def analyze_data(data, analyzers, ext=''):
+    """Wendet alle Analysefunktionen auf einen Inhalt an und gibt die Ergebnisse je Name zurück
+    (None für Binärdaten)"""
+    text, _ = sniff_text(data, ext)
+    if text is None:
+        return {analyzer[0]: None for analyzer in analyzers}
+    return {analyzer[0]: analyzer[1](text) for analyzer in analyzers}
+
+def analyze_mapped(mapped, analyzers, ext=''):
+    """Wendet die Puffer-Analysefunktionen direkt auf eine per mmap eingeblendete Datei an;
+    Analysen ohne Puffer-Funktion bekommen den einmal dekodierten Text"""
+    if ext in BINARY_EXTENSIONS or is_binary_sample(mapped[:SNIFF_SIZE]):
+        return {analyzer[0]: None for analyzer in analyzers}
+
+    # Ohne \n-Zeilenumbrüche (\r, \r\n) wie bisher über den vereinheitlichten Text
+    if mapped.find(b'\r') != -1:
+        return analyze_data(mapped[:], analyzers, ext)
+
+    start = len(UTF8_BOM) if mapped[:len(UTF8_BOM)] == UTF8_BOM else 0
+    results = {}
+    text = decoded = None
+    for name, function, buffer_function in analyzers:
+        if buffer_function is not None:
+            results[name] = buffer_function(mapped, start)
+            continue
+        if not decoded:
+            text, _ = sniff_text(mapped[:], ext)
+            decoded = True
+        results[name] = None if text is None else function(text)
+    return results
+
+def analyze_path(file_path, analyzers, known_digest=None):
+    """Liest eine Datei genau einmal und gibt (Ergebnisse je Name, Fehlermeldung, Inhalts-Hash) zurück.
+
+    analyzers enthält Tupel (Name, Funktion für Text, Funktion für Puffer oder None). Große Dateien
+    werden per mmap durchsucht, sobald eine Analyse eine Puffer-Funktion hat; die übrigen Analysen
+    teilen sich einen einmal dekodierten Text.
+    Stimmt der Inhalts-Hash mit known_digest überein, wird nicht analysiert und None als Ergebnis geliefert.
+    Die Funktion läuft auch in Pool-Prozessen, analyzers muss deshalb picklebar sein.
+    """
+    # Bekannte Binärformate gar nicht erst öffnen
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext in BINARY_EXTENSIONS:
+        return {analyzer[0]: None for analyzer in analyzers}, None, None
+
+    try:
+        with open(file_path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size >= MMAP_THRESHOLD and any(analyzer[2] is not None for analyzer in analyzers):
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    digest = content_hash(mapped)
+                    if digest == known_digest:
+                        return None, None, digest
+                    return analyze_mapped(mapped, analyzers, ext), None, digest
+
+            data = file.read()
+    except Exception as e:
+        return {analyzer[0]: None for analyzer in analyzers}, str(e), None
+
+    digest = content_hash(data)
+    if digest == known_digest:
+        return None, None, digest
+
+    return analyze_data(data, analyzers, ext), None, digest
+
+class Traversal:
+    """Gemeinsamer Dateidurchlauf: alle registrierten Checks teilen sich einen os.walk,
+    jede Datei wird höchstens einmal per stat() geprüft und höchstens einmal gelesen.
+
+    Ein Check (Visitor) stellt bereit:
+      name              - Schlüssel für seine Ergebnisse (auch im Cache)
+      accepts(record)   - ob die Datei für den Check relevant ist (ohne Dateizugriff)
+      analyze           - picklebare Funktion text -> Ergebnis, oder None, wenn kein Inhalt benötigt wird
+      analyze_buffer    - optional: picklebare Funktion (Puffer, Start) -> Ergebnis für große Dateien (mmap)
+      collect(record, result, error) - nimmt das Ergebnis in Durchlauf-Reihenfolge entgegen
+      finish()          - wird nach dem Durchlauf aufgerufen
+    """
+
+    def __init__(self, root_dir, skip_dir=None):
+        self.root_dir = root_dir
+        self.skip_dir = skip_dir
+        self.visitors = []
+
+    def register(self, visitor):
+        """Registriert einen Check und gibt ihn zurück"""
+        self.visitors.append(visitor)
+        return visitor
+
+    def run(self, executor=None, cache=None):
+        """Führt den Durchlauf aus - optional im Prozess-Pool und mit persistentem Scan-Cache.
+
+        Die Dateien werden vom os.walk bis zu collect() durchgereicht, ohne den ganzen Baum zu sammeln.
+        """
+        # Ergebnisse in Durchlauf-Reihenfolge weiterreichen, sobald die jeweilige Datei fertig ist
+        for (record, visitors, hit), analyzed in map_files(analyze_path, executor, self._tasks(cache)):
+            error = None
+            if hit:
+                results = cache.load(record.rel_path)
+            else:
+                results, error, digest = analyzed
+                if cache is not None and record._stat is not None:
+                    if results is None:
+                        # Nur die mtime hat sich geändert, der Inhalt ist gleich geblieben
+                        results = cache.reuse(record.rel_path, record.stat)
+                    elif not error:
+                        cache.store(record.rel_path, record.stat, digest, results)
+
+            for visitor in visitors:
+                visitor.collect(record, results.get(visitor.name) if results else None, error)
+
+        if cache is not None:
+            cache.save()
+
+        for visitor in self.visitors:
+            visitor.finish()
+
+    def _tasks(self, cache):
+        """Liefert pro Datei mit Inhalts-Checks ((Record, Checks, Cache-Treffer), Argumente für analyze_path
+        oder None bei einem Treffer) - die Ergebnisse selbst lädt der Cache erst beim Weiterreichen"""
+        for record in walk_records(self.root_dir, self.skip_dir):
+            interested = [visitor for visitor in self.visitors if visitor.accepts(record)]
+            content_visitors = []
+            for visitor in interested:
+                if visitor.analyze is None:
+                    visitor.collect(record, None, None)
+                else:
+                    content_visitors.append(visitor)
+            if not content_visitors:
+                continue
+
+            names = [visitor.name for visitor in content_visitors]
+            hit, digest = (False, None)
+            if cache is not None:
+                try:
+                    hit, digest = cache.lookup(record.rel_path, record.stat, names)
+                except OSError:
+                    pass
+            if hit:
+                yield (record, content_visitors, hit), None
+                continue
+
+            # Jede Datei einmal lesen und alle interessierten Checks darauf anwenden
+            analyzers = tuple(
+                (visitor.name, visitor.analyze, getattr(visitor, 'analyze_buffer', None))
+                for visitor in content_visitors
+            )
+            yield (record, content_visitors, hit), (record.path, analyzers, digest)
@@ -0,0 +1,167 @@
+import os
+import sys
+import json
+import errno
+import shutil
+import hashlib
+import tempfile
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+# Anzahl der Threads, die Dateien gleichzeitig hashen und kopieren
+SNAPSHOT_WORKERS = 8
+
+# Blockgröße beim Hashen und beim Kopieren über copy_file_range
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# ioctl FICLONE (Linux): legt eine Copy-on-Write-Kopie (Reflink) an, z.B. auf Btrfs oder XFS
+FICLONE = 0x40049409
+
+def file_hash(file_path):
+    """Berechnet den Inhalts-Hash einer Datei blockweise (gleiches Verfahren wie scan_cache.content_hash)"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(COPY_CHUNK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _reflink(src_fd, dst_fd):
+    """Versucht eine Copy-on-Write-Kopie - gibt False zurück, wenn Plattform oder Dateisystem sie nicht kennen"""
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        import fcntl
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError:
+        return False
+
+def _copy_file_range(src_fd, dst_fd, size):
+    """Kopiert im Kernel ohne Umweg über den Userspace - False, wenn copy_file_range nicht verfügbar ist"""
+    if not hasattr(os, 'copy_file_range'):
+        return False
+    copied = 0
+    try:
+        while copied < size:
+            count = os.copy_file_range(src_fd, dst_fd, min(COPY_CHUNK_SIZE * 64, size - copied))
+            if count == 0:
+                break
+            copied += count
+    except OSError as e:
+        if copied == 0 and e.errno in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF):
+            return False
+        raise
+    return True
+
+def fast_copy(src_path, dst_path):
+    """Kopiert eine Datei atomar über den schnellsten verfügbaren Weg:
+    Reflink, copy_file_range, sonst shutil.copyfile (sendfile bzw. fcopyfile)"""
+    dst_dir = os.path.dirname(dst_path)
+    fd, temp_path = tempfile.mkstemp(dir=dst_dir, prefix='.tmp-')
+    try:
+        with open(src_path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+            size = os.fstat(src.fileno()).st_size
+            if not (_reflink(src.fileno(), dst.fileno()) or _copy_file_range(src.fileno(), dst.fileno(), size)):
+                dst.close()
+                shutil.copyfile(src_path, temp_path)
+        shutil.copymode(src_path, temp_path)
+        os.replace(temp_path, dst_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+class SnapshotStore:
+    """Inhaltsadressierter Sicherungsspeicher für Projektdateien.
+
+    Jeder Inhalt liegt genau einmal unter objects/<hash[:2]>/<hash>; ein Snapshot ist nur ein
+    Manifest (relativer Pfad -> Hash). Unveränderte Dateien werden daher nie ein zweites Mal kopiert.
+    """
+
+    def __init__(self, store_dir):
+        self.store_dir = store_dir
+        self.objects_dir = os.path.join(store_dir, 'objects')
+        self.snapshots_dir = os.path.join(store_dir, 'snapshots')
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+
+    def object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def _store_file(self, file_path):
+        """Legt den Inhalt einer Datei im Speicher ab und gibt (Hash, kopiert?) zurück - None für fehlende Dateien"""
+        if not os.path.isfile(file_path):
+            return None, False
+
+        digest = file_hash(file_path)
+        object_path = self.object_path(digest)
+        if os.path.exists(object_path):
+            return digest, False
+
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        fast_copy(file_path, object_path)
+        return digest, True
+
+    def create(self, root_dir, rel_paths):
+        """Sichert alle Dateien in einem Durchgang (parallel) und gibt die Snapshot-ID und die Anzahl
+        tatsächlich kopierter Dateien zurück. Fehlende Dateien werden als solche vermerkt."""
+        rel_paths = list(rel_paths)
+        file_paths = [os.path.join(root_dir, rel_path) for rel_path in rel_paths]
+
+        with ThreadPoolExecutor(max_workers=SNAPSHOT_WORKERS) as executor:
+            stored = list(executor.map(self._store_file, file_paths))
+
+        snapshot_id = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        manifest = {
+            'created': datetime.now().isoformat(),
+            'root_dir': root_dir,
+            'files': {rel_path: digest for rel_path, (digest, _) in zip(rel_paths, stored)}
+        }
+        manifest_path = os.path.join(self.snapshots_dir, f'{snapshot_id}.json')
+        with open(manifest_path, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, indent=2)
+
+        return snapshot_id, sum(copied for _, copied in stored)
+
+    def list(self):
+        """Gibt alle Snapshot-IDs aufsteigend (älteste zuerst) zurück"""
+        return sorted(name[:-len('.json')] for name in os.listdir(self.snapshots_dir) if name.endswith('.json'))
+
+    def load(self, snapshot_id='latest'):
+        """Lädt das Manifest eines Snapshots ('latest' = der neueste)"""
+        if snapshot_id == 'latest':
+            snapshots = self.list()
+            if not snapshots:
+                raise FileNotFoundError(f"Keine Snapshots in {self.snapshots_dir}")
+            snapshot_id = snapshots[-1]
+
+        with open(os.path.join(self.snapshots_dir, f'{snapshot_id}.json'), encoding='utf-8') as file:
+            return snapshot_id, json.load(file)
+
+    def _restore_file(self, file_path, digest):
+        """Stellt eine Datei wieder her - oder entfernt sie, wenn sie beim Snapshot nicht existierte"""
+        if digest is None:
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+            return
+
+        # Bereits identische Dateien bleiben unangetastet
+        if os.path.isfile(file_path) and file_hash(file_path) == digest:
+            return
+
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        fast_copy(self.object_path(digest), file_path)
+
+    def restore(self, root_dir, snapshot_id='latest'):
+        """Setzt alle Dateien eines Snapshots mit einem Aufruf auf den gesicherten Stand zurück"""
+        snapshot_id, manifest = self.load(snapshot_id)
+        files = manifest['files']
+
+        with ThreadPoolExecutor(max_workers=SNAPSHOT_WORKERS) as executor:
+            list(executor.map(
+                self._restore_file,
+                [os.path.join(root_dir, rel_path) for rel_path in files],
+                files.values()
+            ))
+
+        return snapshot_id, len(files)
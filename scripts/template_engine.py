@@ -0,0 +1,42 @@
+import re
+
+# Platzhalter: {{name}} ohne Leerzeichen. JSX-Objekte wie style={{ opacity: 0 }} oder {{ foo }} (so formatiert
+# Prettier Objekt-Literale in JSX) passen nicht auf das Muster und bleiben unverändert stehen
+placeholder_pattern = re.compile(r'\{\{(\w+)\}\}')
+
+class CompiledTemplate:
+    """Einmal in eine Segmentliste zerlegte Vorlage: Text an geraden, Platzhalternamen an ungeraden Positionen.
+
+    Rendern setzt nur noch die Werte in die Lücken - kein erneutes Suchen und kein str.replace pro Variable.
+    Fehlt ein Wert, bricht das Rendern ab, statt {{name}} stillschweigend stehen zu lassen (so fällt auch
+    JSX auf, das versehentlich wie ein Platzhalter aussieht, z.B. {{foo}} ohne Leerzeichen).
+    """
+
+    __slots__ = ('name', 'segments', 'names')
+
+    def __init__(self, name, text):
+        self.name = name
+        self.segments = placeholder_pattern.split(text)
+        self.names = frozenset(self.segments[1::2])
+
+    def check(self, values):
+        """Prüft, ob es für jeden Platzhalter einen Wert gibt"""
+        missing = self.names.difference(values)
+        if missing:
+            raise ValueError(f"Vorlage {self.name}: keine Werte für {', '.join(sorted(missing))}")
+
+    def chunks(self, values):
+        """Gibt die gerenderte Vorlage als Liste von Textstücken zurück, ohne sie zusammenzufügen"""
+        self.check(values)
+        chunks = self.segments[:]
+        for i in range(1, len(chunks), 2):
+            chunks[i] = str(values[chunks[i]])
+        return chunks
+
+    def render(self, values):
+        """Gibt die gerenderte Vorlage als String zurück"""
+        return ''.join(self.chunks(values))
+
+def compile_template(name, text):
+    """Zerlegt den Text einer Vorlage einmal in Segmente"""
+    return CompiledTemplate(name, text)
@@ -0,0 +1,166 @@
+import io
+import os
+import sys
+import atexit
+from types import SimpleNamespace
+
+# Ausgaben werden gesammelt und in Blöcken dieser Größe (Zeichen) geschrieben
+RENDER_BUFFER_SIZE = 64 * 1024
+
+# Puffergröße (Bytes) des io.BufferedWriter, über den sys.stdout nach install_stdout() schreibt
+STDOUT_BUFFER_SIZE = 256 * 1024
+
+# Der gepufferte Ersatz für sys.stdout, sobald install_stdout() einmal gelaufen ist
+_buffered_stdout = None
+
+# Trennzeile zwischen zwei nicht zusammenhängenden Ausschnitten im Kontext-Modus
+context_separator = '   ...'
+
+def detect_color(stream):
+    """Entscheidet einmal, ob Farbcodes ausgegeben werden: nur auf einem Terminal (NO_COLOR/FORCE_COLOR überstimmen)"""
+    if os.environ.get('NO_COLOR'):
+        return False
+    if os.environ.get('FORCE_COLOR'):
+        return True
+    isatty = getattr(stream, 'isatty', None)
+    return bool(isatty and isatty())
+
+use_color = detect_color(sys.stdout)
+
+# ANSI-Codes wie bei colorama - ohne Terminal sind alle Codes leer, die f-Strings enthalten dann keine Farben
+_fore_codes = {
+    'RED': '\x1b[31m', 'GREEN': '\x1b[32m', 'YELLOW': '\x1b[33m', 'BLUE': '\x1b[34m',
+    'MAGENTA': '\x1b[35m', 'CYAN': '\x1b[36m', 'WHITE': '\x1b[37m', 'RESET': '\x1b[39m'
+}
+_style_codes = {'BRIGHT': '\x1b[1m', 'DIM': '\x1b[2m', 'NORMAL': '\x1b[22m', 'RESET_ALL': '\x1b[0m'}
+
+Fore = SimpleNamespace(**{name: code if use_color else '' for name, code in _fore_codes.items()})
+Style = SimpleNamespace(**{name: code if use_color else '' for name, code in _style_codes.items()})
+
+if use_color and os.name == 'nt':
+    # Nur unter Windows mit Farbe wird colorama gebraucht - und nur, um ANSI-Codes in der Konsole einzuschalten
+    try:
+        import colorama
+        colorama.just_fix_windows_console()
+    except (ImportError, AttributeError):
+        pass
+
+def install_stdout(buffer_size=STDOUT_BUFFER_SIZE):
+    """Ersetzt sys.stdout durch einen Text-Wrapper über einem großen io.BufferedWriter.
+
+    print() schreibt dann nicht mehr bei jedem Aufruf, sondern in Blöcken von buffer_size Bytes;
+    der Rest wird beim Beenden geschrieben. Gepuffert wird über dem bisherigen Roh-Stream
+    (sys.stdout.buffer.raw) - unter Windows bleibt so die Konsole (_WindowsConsoleIO) samt
+    Unicode-Ausgabe erhalten. Streams ohne Roh-Stream bleiben unverändert.
+    """
+    global _buffered_stdout
+    stream = sys.stdout
+    if stream is _buffered_stdout:
+        return stream
+    raw = getattr(getattr(stream, 'buffer', None), 'raw', None)
+    if raw is None:
+        return stream
+
+    stream.flush()
+    writer = io.BufferedWriter(raw, buffer_size)
+    _buffered_stdout = io.TextIOWrapper(writer, encoding=stream.encoding, errors=stream.errors)
+    atexit.register(_restore_stdout, stream)
+    sys.stdout = _buffered_stdout
+    return _buffered_stdout
+
+def _restore_stdout(stream):
+    """Schreibt den Rest und setzt den ursprünglichen sys.stdout wieder ein.
+
+    Der Puffer wird vom Roh-Stream gelöst, damit das Aufräumen beim Beenden den Roh-Stream nicht
+    schließt - er gehört weiterhin dem ursprünglichen sys.stdout.
+    """
+    global _buffered_stdout
+    if _buffered_stdout is None:
+        return
+    try:
+        _buffered_stdout.flush()
+    finally:
+        if sys.stdout is _buffered_stdout:
+            sys.stdout = stream
+        _buffered_stdout.detach().detach()
+        _buffered_stdout = None
+
+class BufferedOutput:
+    """Sammelt Ausgaben und schreibt sie in großen Blöcken statt Zeile für Zeile in den Stream.
+
+    Als Kontextmanager verwenden - beim Verlassen wird der Rest geschrieben, damit nachfolgende
+    print()-Aufrufe nicht vor der gepufferten Ausgabe landen.
+    """
+
+    def __init__(self, stream=None, buffer_size=RENDER_BUFFER_SIZE):
+        self.stream = stream if stream is not None else sys.stdout
+        self.buffer_size = buffer_size
+        self.parts = []
+        self.size = 0
+
+    def write(self, text):
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= self.buffer_size:
+            self.flush()
+
+    def line(self, text=''):
+        self.write(text + '\n')
+
+    def flush(self):
+        if self.parts:
+            self.stream.write(''.join(self.parts))
+            self.parts = []
+            self.size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+def context_windows(marked, context):
+    """Fasst die markierten Zeilennummern (aufsteigend) mit ±context Zeilen zu (Start, Ende)-Bereichen zusammen"""
+    windows = []
+    for line_num in marked:
+        start, end = max(1, line_num - context), line_num + context
+        if windows and start <= windows[-1][1] + 1:
+            windows[-1][1] = end
+        else:
+            windows.append([start, end])
+    return windows
+
+def render_lines(out, lines, marks, context=None):
+    """Gibt nummerierte Zeilen aus - nur markierte Zeilen tragen Farbcodes.
+
+    lines ist ein beliebiges Iterable (z.B. ein geöffnetes File), marks ist {Zeilennummer: Präfix}
+    mit bereits formatierter Nummer und Markierung. Mit context werden nur die markierten Zeilen ±context
+    ausgegeben; das Iterable wird nach dem letzten Ausschnitt nicht weiter gelesen.
+    """
+    if context is None:
+        for line_num, line in enumerate(lines, 1):
+            prefix = marks.get(line_num)
+            out.write(f"{line_num:4} {line}\n" if prefix is None else f"{prefix}{line}\n")
+        return
+
+    windows = context_windows(sorted(marks), context)
+    if not windows:
+        out.line(f"{context_separator} (keine markierten Zeilen)")
+        return
+
+    window = 0
+    start, end = windows[0]
+    for line_num, line in enumerate(lines, 1):
+        if line_num < start:
+            continue
+        if line_num > end:
+            window += 1
+            if window == len(windows):
+                break
+            start, end = windows[window]
+            out.line(context_separator)
+            if line_num < start:
+                continue
+
+        prefix = marks.get(line_num)
+        out.write(f"{line_num:4} {line}\n" if prefix is None else f"{prefix}{line}\n")
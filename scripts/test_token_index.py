@@ -0,0 +1,44 @@
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from scan_engine import FileRecord
+from token_index import TokenIndex, tokenize
+
+class TokenIndexTest(unittest.TestCase):
+    """Der Index muss dieselben Zeilen liefern wie die Suche mit re.IGNORECASE"""
+
+    lines = [
+        'İstanbul blog',
+        'xİy blogİ',
+        'Blog-İndex und ıblog',
+        'ſeite blog_post',
+        'kein Treffer',
+    ]
+    patterns = [r'\bblog\b', r'\bistanbul\b', r'\bxiy\b', r'\bxi', r'iy\b', r'\bindex\b', r'\biblog\b', r'\bseite\b', r'blog']
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        path = os.path.join(self.root, 'seite.tsx')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(self.lines) + '\n')
+        self.index = TokenIndex(os.path.join(self.root, '.cache', 'index.sqlite'))
+        self.addCleanup(self.index.close)
+        self.index.update([FileRecord(path, 'seite.tsx')])
+
+    def test_wortgrenzen_mit_sonderfall_zeichen(self):
+        for pattern in self.patterns:
+            expected = [
+                line_num for line_num, line in enumerate(self.lines, 1) if re.search(pattern, line, re.IGNORECASE)
+            ]
+            with self.subTest(pattern=pattern):
+                self.assertEqual(self.index.search(pattern).get('seite.tsx', []), expected)
+
+    def test_token_ohne_kombinierendes_zeichen(self):
+        self.assertEqual(sorted(tokenize('xİy')), ['xiy'])
+
+if __name__ == '__main__':
+    unittest.main()
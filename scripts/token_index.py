@@ -0,0 +1,167 @@
+import os
+import re
+import sqlite3
+from array import array
+
+from scan_engine import SONDERFALL_ZEICHEN, sniff_text
+
+# Version des Index-Formats - bei Änderungen an der Tokenisierung erhöhen
+INDEX_VERSION = 2
+
+# Ein Token ist eine Folge von Wortzeichen - genau die Grenzen, an denen \b in regulären Ausdrücken greift
+word_pattern = re.compile(r'\w+')
+
+# Zeichen, die re.IGNORECASE wie i bzw. s behandelt - str.lower() tut das nicht ('İ'.lower() ergibt sogar
+# zwei Zeichen, i und U+0307, das kein Wortzeichen ist)
+sonderfall_faltung = str.maketrans('İıſ', 'iis')
+
+# Muster, die sich über den Index beantworten lassen: Wortzeichen mit optionalem \b davor und/oder danach
+query_pattern = re.compile(r'(\\b)?(\w+)(\\b)?')
+
+def fold_token(word):
+    """Schreibt ein Token so klein, wie re.IGNORECASE es vergleicht"""
+    return word.translate(sonderfall_faltung).lower()
+
+def tokenize(text):
+    """Zerlegt einen Text in kleingeschriebene Tokens und gibt {Token: array('I') der Zeilennummern} zurück"""
+    postings = {}
+    findall = word_pattern.findall
+    if SONDERFALL_ZEICHEN.search(text):
+        # Erst zerlegen, dann jedes Token falten - sonst verschiebt 'İ'.lower() die Wortgrenzen
+        token_lines = ([fold_token(token) for token in findall(line)] for line in text.split('\n'))
+    else:
+        token_lines = (findall(line) for line in text.lower().split('\n'))
+
+    for line_num, tokens in enumerate(token_lines, 1):
+        for token in set(tokens):
+            lines = postings.get(token)
+            if lines is None:
+                postings[token] = array('I', [line_num])
+            else:
+                lines.append(line_num)
+    return postings
+
+def parse_query(pattern):
+    """Übersetzt ein Suchmuster in (Art, Token) - Art ist 'exact', 'prefix', 'suffix' oder 'substring';
+    None, wenn das Muster Zeichen außer Wortzeichen enthält und sich nicht über den Index beantworten lässt"""
+    match = query_pattern.fullmatch(pattern)
+    if match is None:
+        return None
+
+    start, word, end = match.groups()
+    word = fold_token(word)
+    if start and end:
+        return 'exact', word
+    if start:
+        return 'prefix', word
+    if end:
+        return 'suffix', word
+    return 'substring', word
+
+def _like_escape(word):
+    return word.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+class TokenIndex:
+    """Persistenter invertierter Index (SQLite): Token -> (Datei, Zeilen).
+
+    Wortgrenzen-Suchen wie \\bblog\\b werden zu einem Lookup über die Treffer, statt jede Datei
+    mit mehreren Mustern zu durchsuchen. Groß-/Kleinschreibung wird wie bei re.IGNORECASE ignoriert.
+    update() liest nur Dateien neu ein, deren mtime oder Größe sich geändert hat.
+    """
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        self.connection = sqlite3.connect(index_path)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != str(INDEX_VERSION):
+            self.connection.execute('DROP TABLE IF EXISTS files')
+            self.connection.execute('DROP TABLE IF EXISTS postings')
+            self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (str(INDEX_VERSION),))
+
+        self.connection.execute('CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER)')
+        self.connection.execute('CREATE TABLE IF NOT EXISTS postings (token TEXT, path TEXT, lines BLOB)')
+        self.connection.execute('CREATE INDEX IF NOT EXISTS postings_token ON postings (token)')
+        self.connection.execute('CREATE INDEX IF NOT EXISTS postings_path ON postings (path)')
+        self.connection.commit()
+
+    def update(self, records, complete=False):
+        """Bringt den Index für die übergebenen FileRecords auf den aktuellen Stand.
+
+        Mit complete=True gelten die Records als vollständiger Durchlauf - Dateien, die nicht mehr
+        vorkommen, werden entfernt. Gibt (neu eingelesene, entfernte) Dateien zurück.
+        """
+        known = {
+            path: (mtime_ns, size)
+            for path, mtime_ns, size in self.connection.execute('SELECT path, mtime_ns, size FROM files')
+        }
+        seen = set()
+        updated = 0
+
+        with self.connection:
+            for record in records:
+                seen.add(record.rel_path)
+                try:
+                    stat_result = record.stat
+                    if known.get(record.rel_path) == (stat_result.st_mtime_ns, stat_result.st_size):
+                        continue
+                    text, _ = sniff_text(record.data, record.ext)
+                except OSError:
+                    continue
+
+                self.connection.execute('DELETE FROM postings WHERE path = ?', (record.rel_path,))
+                if text is not None:
+                    self.connection.executemany(
+                        'INSERT INTO postings VALUES (?, ?, ?)',
+                        ((token, record.rel_path, lines.tobytes()) for token, lines in tokenize(text).items())
+                    )
+                self.connection.execute(
+                    'INSERT OR REPLACE INTO files VALUES (?, ?, ?)',
+                    (record.rel_path, stat_result.st_mtime_ns, stat_result.st_size)
+                )
+                updated += 1
+
+            removed = [path for path in known if path not in seen] if complete else []
+            self.connection.executemany('DELETE FROM postings WHERE path = ?', ((path,) for path in removed))
+            self.connection.executemany('DELETE FROM files WHERE path = ?', ((path,) for path in removed))
+
+        return updated, len(removed)
+
+    def _rows(self, kind, word):
+        if kind == 'exact':
+            return self.connection.execute('SELECT path, lines FROM postings WHERE token = ?', (word,))
+        if kind == 'prefix':
+            upper = word[:-1] + chr(ord(word[-1]) + 1)
+            return self.connection.execute(
+                'SELECT path, lines FROM postings WHERE token >= ? AND token < ?', (word, upper)
+            )
+        like = f'%{_like_escape(word)}' if kind == 'suffix' else f'%{_like_escape(word)}%'
+        return self.connection.execute("SELECT path, lines FROM postings WHERE token LIKE ? ESCAPE '\\'", (like,))
+
+    def search(self, pattern):
+        """Gibt {Datei: sortierte Zeilennummern} für ein Muster zurück - None, wenn es nicht indexierbar ist"""
+        if parse_query(pattern) is None:
+            return None
+        hits, _ = self.search_all([pattern])
+        return hits
+
+    def search_all(self, patterns):
+        """Sucht mehrere Muster auf einmal - gleiche Tokens (z.B. \\bblog\\b und \\bBlog\\b) nur einmal.
+        Gibt ({Datei: Zeilen}, nicht indexierbare Muster) zurück"""
+        hits = {}
+        unindexed = []
+        for query in dict.fromkeys(parse_query(pattern) or pattern for pattern in patterns):
+            if isinstance(query, str):
+                unindexed.append(query)
+                continue
+            for path, lines in self._rows(*query):
+                line_nums = array('I')
+                line_nums.frombytes(lines)
+                hits.setdefault(path, set()).update(line_nums)
+        return {path: sorted(lines) for path, lines in hits.items()}, unindexed
+
+    def close(self):
+        """Schließt die Datenbankverbindung"""
+        self.connection.close()